@@ -224,7 +224,14 @@ async def interactive_chat(
                     ],
                 )
                 # Disable write tools completely
-                for tool_name in ["write_file", "edit_file", "delete_file", "todo", "sub_agent"]:
+                for tool_name in [
+                    "write_file",
+                    "edit_file",
+                    "delete_file",
+                    "todo",
+                    "sub_agent",
+                    "sub_agents",
+                ]:
                     config.tools.security[tool_name] = ToolSecurityConfig(
                         permission=ToolPermission.NEVER
                     )
@@ -295,7 +302,14 @@ async def interactive_chat(
         # Post-Registry Mode Logic (Hiding Tools)
         if mode == "plan":
             # Completely hide write tools so the agent doesn't even know they exist
-            for tool_name in ["write_file", "edit_file", "delete_file", "todo", "sub_agent"]:
+            for tool_name in [
+                "write_file",
+                "edit_file",
+                "delete_file",
+                "todo",
+                "sub_agent",
+                "sub_agents",
+            ]:
                 agent.tools.unregister(tool_name)
 
         # Setup MCP integration if enabled
@@ -70,18 +70,7 @@ class Agent:
         self.event_bus = get_event_bus()
 
         # Create session-specific logger
-        self.session_logger: SessionLoggerAdapter | None
-        if session_id:
-            log_manager = get_session_log_manager()
-            self.session_logger = log_manager.create_session_logger(
-                session_id=session_id,
-                agent_mode=config.mode.value,
-                log_level="INFO",
-                parent_session_id=parent_session_id,  # Child agents write to parent's log
-            )
-        else:
-            # Fallback to default logger if no session ID
-            self.session_logger = None
+        self.session_logger = self._create_session_logger(session_id, parent_session_id)
 
         # Enable execution logging for child agents only
         self.execution_log: ExecutionLog | None = None
@@ -126,6 +115,52 @@ class Agent:
             event_bus=self.event_bus,
         )
 
+    def _create_session_logger(
+        self, session_id: str | None, parent_session_id: str | None
+    ) -> SessionLoggerAdapter | None:
+        """Create session-specific logger (None falls back to default logger)."""
+        if not session_id:
+            return None
+        return get_session_log_manager().create_session_logger(
+            session_id=session_id,
+            agent_mode=self.config.mode.value,
+            log_level="INFO",
+            parent_session_id=parent_session_id,  # Child agents write to parent's log
+        )
+
+    def reset(
+        self,
+        memory: ConversationMemory,
+        session_id: str | None,
+        parent_session_id: str | None = None,
+    ) -> None:
+        """Rebind agent to a new conversation and session.
+
+        Keeps tools, provider and console so pooled child agents can be reused
+        across delegations without being rebuilt.
+
+        Args:
+            memory: Fresh conversation memory
+            session_id: New session ID
+            parent_session_id: Parent's session ID (child agents log there)
+        """
+        self.memory = memory
+        self.session_id = session_id
+        self.session_logger = self._create_session_logger(session_id, parent_session_id)
+
+        self.execution_log = ExecutionLog() if self.config.mode == AgentMode.CHILD else None
+        self.status = AgentStatus(
+            session_id=session_id or "unknown",
+            mode=self.config.mode.value,
+            state=AgentState.IDLE,
+        )
+
+        self.state_manager.status = self.status
+        self.state_manager.session_id = session_id
+        self.state_manager.session_logger = self.session_logger
+
+        self.tool_executor.reset(session_id, self.session_logger, self.execution_log)
+
     async def run(self, user_input: str) -> str:
         """Main agent loop with tool use.
 
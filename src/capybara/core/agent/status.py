@@ -23,5 +23,5 @@ class AgentStatus:
     mode: str  # "parent" or "child"
     state: AgentState
     current_action: str | None = None  # "Running grep", "Delegating task", etc.
-    child_sessions: list[str] = field(default_factory=list)
+    child_sessions: set[str] = field(default_factory=set)
     parent_session: str | None = None
@@ -11,6 +11,7 @@ from capybara.core.config.settings import (
     ToolPermission,
     ToolsConfig,
     ToolSecurityConfig,
+    get_config_path,
     get_default_bash_allowlist,
     init_config,
     load_config,
@@ -26,6 +27,7 @@ __all__ = [
     "ToolPermission",
     "MCPConfig",
     "MCPServerConfig",
+    "get_config_path",
     "load_config",
     "save_config",
     "init_config",
@@ -40,6 +40,7 @@ class ToolsConfig(BaseModel):
     bash_timeout: int = 120
     filesystem_enabled: bool = True
     allowed_paths: list[str] = Field(default_factory=lambda: ["."])
+    sub_agent_subprocess: bool = False  # Run sub-agents as separate processes
 
     # Permission settings
     security: dict[str, ToolSecurityConfig] = Field(default_factory=dict)
@@ -1,5 +1,6 @@
 """Structured failure handling for child agents."""
 
+from collections.abc import Collection, Sequence
 from dataclasses import dataclass
 from enum import Enum
 
@@ -25,12 +26,12 @@ class ChildFailure:
 
     # Partial progress
     completed_steps: list[str]
-    files_modified: list[str]
+    files_modified: Collection[str]
 
     # Recovery guidance
     blocked_on: str | None
     suggested_retry: bool
-    suggested_actions: list[str]
+    suggested_actions: Sequence[str]
 
     # Execution context
     tool_usage: dict[str, int]
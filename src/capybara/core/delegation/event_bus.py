@@ -46,8 +46,8 @@ class EventBus:
     """In-memory async event bus for session events."""
 
     def __init__(self):
-        # session_id -> Queue of subscribers
-        self._subscribers: dict[str, list[asyncio.Queue]] = {}
+        # session_id -> (queue, event type filter) of subscribers
+        self._subscribers: dict[str, list[tuple[asyncio.Queue, frozenset[EventType] | None]]] = {}
         # session_id -> recent events (for late subscribers)
         self._history: dict[str, list[Event]] = {}
         self._max_history = 100
@@ -67,25 +67,57 @@ class EventBus:
 
         # Send to subscribers
         if session_id in self._subscribers:
-            for queue in self._subscribers[session_id]:
+            for queue, types in self._subscribers[session_id]:
+                if types is not None and event.event_type not in types:
+                    continue
                 try:
                     await queue.put(event)
                 except Exception as e:
                     logger.error(f"Error publishing event: {e}")
 
-    async def subscribe(self, session_id: str) -> AsyncIterator[Event]:
-        """Subscribe to events from a session. Yields events as they arrive."""
+    def _add_subscriber(
+        self, session_id: str, types: set[EventType] | None
+    ) -> tuple[asyncio.Queue, frozenset[EventType] | None]:
+        """Register a subscriber queue, pre-filled with recent history."""
         queue: asyncio.Queue = asyncio.Queue()
+        # AGENT_DONE always passes: it ends the subscription
+        type_filter = frozenset(types) | {EventType.AGENT_DONE} if types is not None else None
+        subscriber = (queue, type_filter)
 
         # Register subscriber
         if session_id not in self._subscribers:
             self._subscribers[session_id] = []
-        self._subscribers[session_id].append(queue)
+        self._subscribers[session_id].append(subscriber)
 
         # Replay recent history to catch up
         if session_id in self._history:
             for event in self._history[session_id]:
-                await queue.put(event)
+                if type_filter is None or event.event_type in type_filter:
+                    queue.put_nowait(event)
+
+        return subscriber
+
+    def _remove_subscriber(
+        self, session_id: str, subscriber: tuple[asyncio.Queue, frozenset[EventType] | None]
+    ) -> None:
+        """Unregister a subscriber queue."""
+        if session_id in self._subscribers:
+            self._subscribers[session_id].remove(subscriber)
+            if not self._subscribers[session_id]:
+                del self._subscribers[session_id]
+
+    async def subscribe(
+        self, session_id: str, types: set[EventType] | None = None
+    ) -> AsyncIterator[Event]:
+        """Subscribe to events from a session. Yields events as they arrive.
+
+        Args:
+            session_id: Session to subscribe to
+            types: Only deliver these event types (AGENT_DONE is always delivered).
+                Filtered events are never queued for this subscriber.
+        """
+        subscriber = self._add_subscriber(session_id, types)
+        queue = subscriber[0]
 
         try:
             while True:
@@ -97,10 +129,42 @@ class EventBus:
                     break
         finally:
             # Cleanup
-            if session_id in self._subscribers:
-                self._subscribers[session_id].remove(queue)
-                if not self._subscribers[session_id]:
-                    del self._subscribers[session_id]
+            self._remove_subscriber(session_id, subscriber)
+
+    async def subscribe_batched(
+        self, session_id: str, max_batch: int = 32, types: set[EventType] | None = None
+    ) -> AsyncIterator[list[Event]]:
+        """Subscribe to events from a session, yielding everything queued per wakeup.
+
+        Waits for one event, then drains up to max_batch - 1 more that are
+        already queued, so bursts are handled in one consumer step.
+
+        Args:
+            session_id: Session to subscribe to
+            max_batch: Max events per yielded batch
+            types: Only deliver these event types (AGENT_DONE is always delivered)
+
+        Yields:
+            Non-empty lists of events in publish order
+        """
+        subscriber = self._add_subscriber(session_id, types)
+        queue = subscriber[0]
+
+        try:
+            while True:
+                batch = [await queue.get()]
+                while len(batch) < max_batch and not queue.empty():
+                    batch.append(queue.get_nowait())
+
+                # Stop after agent done
+                for i, event in enumerate(batch):
+                    if event.event_type == EventType.AGENT_DONE:
+                        yield batch[: i + 1]
+                        return
+                yield batch
+        finally:
+            # Cleanup
+            self._remove_subscriber(session_id, subscriber)
 
     def get_recent(self, session_id: str, limit: int = 50) -> list[Event]:
         """Get recent events for a session (non-blocking)."""
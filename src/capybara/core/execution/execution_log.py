@@ -1,7 +1,8 @@
 """Execution tracking for child agent operations."""
 
 from collections import Counter
-from dataclasses import dataclass, field
+from dataclasses import asdict, dataclass, field
+from typing import Any
 
 
 @dataclass
@@ -40,6 +41,26 @@ class ExecutionLog:
         """All files written or edited."""
         return self.files_written | self.files_edited
 
+    def record_read(self, path: str) -> None:
+        """Record a file read."""
+        self.files_read.add(path)
+
+    def record_written(self, path: str) -> None:
+        """Record a file write."""
+        self.files_written.add(path)
+
+    def record_edited(self, path: str) -> None:
+        """Record a file edit."""
+        self.files_edited.add(path)
+
+    def sorted_files_read(self) -> list[str]:
+        """Files read, sorted."""
+        return sorted(self.files_read)
+
+    def sorted_files_modified(self) -> list[str]:
+        """Files written or edited, sorted."""
+        return sorted(self.files_written | self.files_edited)
+
     @property
     def tool_usage_summary(self) -> dict[str, int]:
         """Count of each tool used."""
@@ -52,3 +73,24 @@ class ExecutionLog:
             return 1.0
         successes = sum(1 for te in self.tool_executions if te.success)
         return successes / len(self.tool_executions)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to JSON-compatible dict (e.g. to hand over from a child process)."""
+        return {
+            "files_read": sorted(self.files_read),
+            "files_written": sorted(self.files_written),
+            "files_edited": sorted(self.files_edited),
+            "tool_executions": [asdict(te) for te in self.tool_executions],
+            "errors": [list(error) for error in self.errors],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ExecutionLog":
+        """Rebuild execution log from to_dict() output."""
+        return cls(
+            files_read=set(data.get("files_read", ())),
+            files_written=set(data.get("files_written", ())),
+            files_edited=set(data.get("files_edited", ())),
+            tool_executions=[ToolExecution(**te) for te in data.get("tool_executions", ())],
+            errors=[(tool, msg) for tool, msg in data.get("errors", ())],
+        )
@@ -64,6 +64,24 @@ class ToolExecutor:
         self.event_bus = event_bus
         self._approve_all = False  # Track "approve all" permission state
 
+    def reset(
+        self,
+        session_id: str | None,
+        session_logger: SessionLoggerAdapter | None,
+        execution_log: ExecutionLog | None,
+    ) -> None:
+        """Rebind executor to a new run, dropping all per-run state.
+
+        Args:
+            session_id: New session ID for events
+            session_logger: New session logger
+            execution_log: New execution log for tracking
+        """
+        self.session_id = session_id
+        self.session_logger = session_logger
+        self.execution_log = execution_log
+        self._approve_all = False  # Permission grants don't carry over
+
     async def execute_tools(
         self,
         tool_calls: list[dict[str, Any]],
@@ -292,8 +310,10 @@ class ToolExecutor:
                 result = await execute_one(tc)
                 results_with_permission.append(result)
 
-        # Check if we're executing sub_agent (which has its own progress display)
-        has_sub_agent = any(tc["function"]["name"] == "sub_agent" for tc in auto_approved)
+        # Check if we're executing sub-agents (which have their own progress display)
+        has_sub_agent = any(
+            tc["function"]["name"] in ("sub_agent", "sub_agents") for tc in auto_approved
+        )
 
         # Execute auto-approved tools in PARALLEL with Live UI
         results_auto = []
@@ -591,11 +611,11 @@ class ToolExecutor:
 
         # Track file operations
         if name == "read_file":
-            self.execution_log.files_read.add(args.get("file_path", ""))
+            self.execution_log.record_read(args.get("file_path", ""))
         elif name == "write_file":
-            self.execution_log.files_written.add(args.get("file_path", ""))
+            self.execution_log.record_written(args.get("file_path", ""))
         elif name == "edit_file":
-            self.execution_log.files_edited.add(args.get("file_path", ""))
+            self.execution_log.record_edited(args.get("file_path", ""))
 
     def _log_tool_result(self, name: str, result: Any, success: bool, duration: float) -> None:
         """Log tool result."""
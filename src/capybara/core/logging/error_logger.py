@@ -4,6 +4,8 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from .queue import submit
+
 
 class ErrorLogManager:
     """Manages error-only logging with separate error log files."""
@@ -85,11 +87,15 @@ def log_error(
         session_id: Optional session ID
         agent_mode: Optional agent mode
     """
-    error_logger = get_error_log_manager().get_error_logger()
-
     session_info = f" [session={session_id[:8]}]" if session_id else ""
     agent_info = f" [agent={agent_mode}]" if agent_mode else ""
+    message = f"{context}{session_info}{agent_info}: {type(error).__name__}: {error}"
+
+    # Written on the background log thread. Pass the exception itself since
+    # sys.exc_info() is empty there.
+    submit(_write_error, message, error)
+
 
-    error_logger.error(
-        f"{context}{session_info}{agent_info}: {type(error).__name__}: {error}", exc_info=True
-    )
+def _write_error(message: str, error: Exception) -> None:
+    """Write error record with traceback to the error log."""
+    get_error_log_manager().get_error_logger().error(message, exc_info=error)
@@ -3,6 +3,8 @@
 import logging
 from typing import Any
 
+from .queue import submit
+
 
 def log_agent_behavior(logger: logging.LoggerAdapter, event_type: str, details: dict[str, Any]):
     """Log agent behavior events with structured format.
@@ -30,7 +32,8 @@ def log_delegation(
         **kwargs: Additional context
     """
     details = {"action": action, "parent": parent_session[:8], "child": child_session[:8], **kwargs}
-    log_agent_behavior(logger, "delegation", details)
+    # Written on the background log thread; delegation runs on the event loop
+    submit(log_agent_behavior, logger, "delegation", details)
 
 
 def log_tool_execution(
@@ -0,0 +1,42 @@
+"""Background writer for log calls made from the event loop.
+
+Log helpers write to file handlers synchronously. Calls routed through
+submit() run in order on a single worker thread instead, so the event loop
+never blocks on log file writes. Pending calls are written before the
+interpreter exits.
+"""
+
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Get or create the log writer thread."""
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="capybara-log")
+    return _executor
+
+
+def submit(func: Callable[..., Any], /, *args: Any, **kwargs: Any) -> None:
+    """Queue a log call to run on the background writer thread.
+
+    Args:
+        func: Logging function to call
+        *args: Positional arguments for func
+        **kwargs: Keyword arguments for func
+    """
+    _get_executor().submit(func, *args, **kwargs)
+
+
+def flush(timeout: float | None = None) -> None:
+    """Block until all queued log calls have been written.
+
+    Args:
+        timeout: Max seconds to wait (None waits indefinitely)
+    """
+    if _executor is not None:
+        _executor.submit(lambda: None).result(timeout)
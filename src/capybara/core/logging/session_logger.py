@@ -4,6 +4,8 @@ import logging
 from datetime import datetime
 from pathlib import Path
 
+from .queue import flush
+
 
 class SessionLoggerAdapter(logging.LoggerAdapter):
     """Logger adapter that adds session and agent context to all log messages."""
@@ -113,6 +115,9 @@ class SessionLogManager:
         if session_id not in self._session_handlers:
             return
 
+        # Write queued records before their file handlers close
+        flush()
+
         logger_name = f"capybara.session.{session_id}"
         logger = logging.getLogger(logger_name)
 
@@ -162,6 +162,7 @@ Preserve all styles exactly. Create backup before modification.
 - Provide file paths and requirements
 - Set appropriate timeout (120-300s)
 - Review work report before continuing
+- For several independent tasks, use `sub_agents(tasks=[{{"task": ...}}, ...])` to run them in parallel
 
 ## 11. Error Handling
 - Read error messages carefully
@@ -181,6 +182,7 @@ Preserve all styles exactly. Create backup before modification.
 - which: Check if commands exist
 - todo: Manage task lists
 - sub_agent: Delegate autonomous work
+- sub_agents: Delegate independent tasks to parallel sub-agents
 
 # Workflow Process
 
@@ -100,25 +100,40 @@ class ConversationStorage:
         message: dict[str, Any],
     ) -> None:
         """Save a message to a session."""
+        await self.save_messages(session_id, [message])
+
+    async def save_messages(
+        self,
+        session_id: str,
+        messages: list[dict[str, Any]],
+    ) -> None:
+        """Save multiple messages to a session in a single transaction."""
+        if not messages:
+            return
+
         await self._init_db()
         now = datetime.now(timezone.utc).isoformat()
 
-        tool_calls = message.get("tool_calls")
-        tool_calls_json = json.dumps(tool_calls) if tool_calls else None
-
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """INSERT INTO messages
-                   (session_id, role, content, tool_calls, tool_call_id, created_at)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
+        rows = []
+        for message in messages:
+            tool_calls = message.get("tool_calls")
+            rows.append(
                 (
                     session_id,
                     message.get("role"),
                     message.get("content"),
-                    tool_calls_json,
+                    json.dumps(tool_calls) if tool_calls else None,
                     message.get("tool_call_id"),
                     now,
-                ),
+                )
+            )
+
+        async with aiosqlite.connect(self.db_path) as db:
+            await db.executemany(
+                """INSERT INTO messages
+                   (session_id, role, content, tool_calls, tool_call_id, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                rows,
             )
             await db.execute(
                 "UPDATE sessions SET updated_at = ? WHERE id = ?",
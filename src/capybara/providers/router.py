@@ -33,6 +33,11 @@ class ProviderRouter:
         if providers:
             self._init_router(providers)
 
+    @property
+    def providers(self) -> list[ProviderConfig]:
+        """Provider configurations this router was built from."""
+        return self._providers
+
     def _resolve_litellm_model(self, provider: ProviderConfig) -> str:
         """Resolve full model string for LiteLLM based on api_type."""
         model = provider.model
@@ -1,13 +1,19 @@
 """Built-in tools: filesystem, bash, search."""
 
-from typing import Optional
+import importlib
+from typing import Any
 
-from capybara.tools.builtin.bash import register_bash_tools
-from capybara.tools.builtin.filesystem import register_filesystem_tools
-from capybara.tools.builtin.search import register_search_tools
-from capybara.tools.builtin.todo import register_todo_tool
 from capybara.tools.registry import ToolRegistry
 
+# Tool modules are imported on first registration rather than at package
+# import, so importing a single submodule (e.g. todo) stays cheap.
+_TOOL_MODULES = (
+    "capybara.tools.builtin.filesystem:register_filesystem_tools",
+    "capybara.tools.builtin.bash:register_bash_tools",
+    "capybara.tools.builtin.search:register_search_tools",
+    "capybara.tools.builtin.todo:register_todo_tool",
+)
+
 
 def register_builtin_tools(
     registry: ToolRegistry,
@@ -25,12 +31,9 @@ def register_builtin_tools(
         session_manager: Optional session manager (enables solve_task)
         storage: Optional conversation storage (enables solve_task)
     """
-    register_filesystem_tools(registry)
-    register_bash_tools(registry)
-    register_search_tools(registry)
-    register_search_tools(registry)
-
-    register_todo_tool(registry)
+    for entry in _TOOL_MODULES:
+        module_name, func_name = entry.split(":")
+        getattr(importlib.import_module(module_name), func_name)(registry)
 
     # Only register sub-agent if dependencies provided
     if all([parent_session_id, parent_agent, session_manager, storage]):
@@ -46,8 +49,18 @@ def register_builtin_tools(
             )
 
 
-# Create and populate the default registry (without delegation)
-registry = ToolRegistry()
-register_builtin_tools(registry)
+# Default registry (without delegation), built on first access
+_registry: ToolRegistry | None = None
+
+
+def __getattr__(name: str) -> Any:
+    global _registry
+    if name == "registry":
+        if _registry is None:
+            _registry = ToolRegistry()
+            register_builtin_tools(_registry)
+        return _registry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = ["registry", "register_builtin_tools"]
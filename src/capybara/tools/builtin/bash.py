@@ -1,6 +1,9 @@
 """Bash execution tool with timeout and safety."""
 
 import asyncio
+import os
+import signal
+import sys
 
 from capybara.tools.registry import ToolRegistry
 
@@ -64,14 +67,22 @@ Safety:
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
                 cwd=cwd,
+                # Own process group, so background children can be killed with the shell
+                start_new_session=True,
             )
 
+            # Bound communicate() itself: children that inherited the output pipes
+            # keep them open after the shell exits
             try:
-                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=timeout)
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
             except asyncio.TimeoutError:
-                process.kill()
+                _kill(process)
                 await process.wait()
                 return f"Error: Command timed out after {timeout}s"
+            except asyncio.CancelledError:
+                # Don't leave the subprocess orphaned when the caller is cancelled
+                _kill(process)
+                raise
 
             output_parts = []
             if stdout:
@@ -120,3 +131,14 @@ Safety:
             return f"Command not found: {command}"
         except Exception as e:
             return f"Error: {e}"
+
+
+def _kill(process: asyncio.subprocess.Process) -> None:
+    """Kill a subprocess and its process group, ignoring processes that already exited."""
+    try:
+        if sys.platform == "win32":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
@@ -1,28 +1,49 @@
 """Sub-agent creation and configuration."""
 
+import functools
+
 from rich.console import Console
 
 from capybara.core.agent import Agent, AgentConfig
+from capybara.core.config import ToolsConfig
 from capybara.core.utils.prompts import build_child_system_prompt
 from capybara.memory.window import ConversationMemory, MemoryConfig
+from capybara.providers.router import ProviderRouter
 from capybara.tools.base import AgentMode
 from capybara.tools.registry import ToolRegistry
 
 
-def create_sub_agent(
-    parent_agent: Agent, child_session_id: str, parent_session_id: str, timeout: float
-) -> Agent:
-    """Create and configure sub-agent for autonomous work.
+@functools.lru_cache(maxsize=1)
+def _child_tool_template() -> ToolRegistry:
+    """Build the builtin tool registry once; sub-agents get clones of it."""
+    from capybara.tools.builtin import register_builtin_tools
 
-    Sub-agent configuration:
-    - Inherits parent's model and provider (API keys)
-    - Gets CHILD mode tools (excludes sub_agent/todo)
-    - Uses work-focused system prompt
-    - Has own console for isolated output
-    - Tracks execution via execution_log
+    registry = ToolRegistry()
+    register_builtin_tools(registry)
+    return registry
+
+
+def create_child_memory() -> ConversationMemory:
+    """Create fresh child memory with work-focused system prompt."""
+    child_memory = ConversationMemory(config=MemoryConfig(max_tokens=100_000))
+    child_memory.set_system_prompt(build_child_system_prompt())
+    return child_memory
+
+
+def build_child_agent(
+    model: str,
+    provider: ProviderRouter,
+    tools_config: ToolsConfig,
+    child_session_id: str,
+    parent_session_id: str,
+    timeout: float,
+) -> Agent:
+    """Build a CHILD-mode agent with a quiet console and fresh memory.
 
     Args:
-        parent_agent: Parent agent to inherit config from
+        model: Model to run the child with
+        provider: Provider router (carries API keys)
+        tools_config: Tool permissions for the child
         child_session_id: Session ID for child
         parent_session_id: Parent's session ID for logging
         timeout: Max execution time
@@ -31,13 +52,9 @@ def create_sub_agent(
         Configured sub-agent ready for execution
     """
 
-    # Initialize child memory with work-focused prompt
-    child_memory = ConversationMemory(config=MemoryConfig(max_tokens=100_000))
-    child_memory.set_system_prompt(build_child_system_prompt())
-
     # Configure child for autonomous work
     child_config = AgentConfig(
-        model=parent_agent.config.model,
+        model=model,
         max_turns=70,
         timeout=timeout,
         stream=True,
@@ -45,10 +62,7 @@ def create_sub_agent(
     )
 
     # Setup child tools (filtered by CHILD mode)
-    from capybara.tools.builtin import register_builtin_tools
-
-    child_tools = ToolRegistry()
-    register_builtin_tools(child_tools)
+    child_tools = _child_tool_template().clone()
 
     # Create child with quiet console (suppresses Live displays to prevent UI clutter)
     # Child's tool execution should not spam parent's terminal with status panels
@@ -56,14 +70,44 @@ def create_sub_agent(
 
     child_console = Console(file=StringIO(), quiet=True, force_terminal=False)
 
-    # Create agent (inherits parent's provider for API keys)
     return Agent(
         config=child_config,
-        memory=child_memory,
+        memory=create_child_memory(),
         tools=child_tools,
         console=child_console,
+        provider=provider,
+        tools_config=tools_config,
+        session_id=child_session_id,
+        parent_session_id=parent_session_id,
+    )
+
+
+def create_sub_agent(
+    parent_agent: Agent, child_session_id: str, parent_session_id: str, timeout: float
+) -> Agent:
+    """Create and configure sub-agent for autonomous work.
+
+    Sub-agent configuration:
+    - Inherits parent's model and provider (API keys)
+    - Gets CHILD mode tools (excludes sub_agent/todo)
+    - Uses work-focused system prompt
+    - Has own console for isolated output
+    - Tracks execution via execution_log
+
+    Args:
+        parent_agent: Parent agent to inherit config from
+        child_session_id: Session ID for child
+        parent_session_id: Parent's session ID for logging
+        timeout: Max execution time
+
+    Returns:
+        Configured sub-agent ready for execution
+    """
+    return build_child_agent(
+        model=parent_agent.config.model,
         provider=parent_agent.provider,  # CRITICAL: Inherit API keys
         tools_config=parent_agent.tools_config,
-        session_id=child_session_id,
+        child_session_id=child_session_id,
         parent_session_id=parent_session_id,
+        timeout=timeout,
     )
@@ -0,0 +1,169 @@
+"""Run a sub-agent in a separate Python process.
+
+The parent writes a JSON request file and spawns
+``python -m capybara.tools.builtin.delegation.child_runner <request> <output>``.
+The child builds its own provider and agent from the request, runs the task
+and writes the response, messages and execution log to the output file.
+Running children as processes lets sibling sub-agents use separate CPU cores
+and keeps a crashing child out of the parent's heap.
+"""
+
+import asyncio
+import json
+import sys
+import tempfile
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from capybara.core.agent import Agent
+from capybara.core.execution.execution_log import ExecutionLog
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
+
+@dataclass
+class ChildProcessResult:
+    """Outcome reported by a child process."""
+
+    response: str
+    messages: list[dict[str, Any]]
+    execution_log: ExecutionLog | None
+    error: str | None = None
+
+
+async def run_child_process(
+    task: str,
+    parent_agent: Agent,
+    child_session_id: str,
+    parent_session_id: str,
+    timeout: float,
+) -> ChildProcessResult:
+    """Run sub-agent task in a child process.
+
+    The request file carries the parent's provider configs (API keys) and is
+    written to a private temporary directory that is removed afterwards.
+    The child has no terminal, so tools that need interactive approval are denied.
+
+    Args:
+        task: Task for the sub-agent
+        parent_agent: Parent agent to inherit model, providers and tools config from
+        child_session_id: Session ID for child
+        parent_session_id: Parent's session ID for logging
+        timeout: Max execution time in seconds
+
+    Returns:
+        Child process result (error is set if the child failed)
+
+    Raises:
+        asyncio.TimeoutError: If the child doesn't finish within timeout
+    """
+    request = {
+        "task": task,
+        "model": parent_agent.config.model,
+        "timeout": timeout,
+        "child_session_id": child_session_id,
+        "parent_session_id": parent_session_id,
+        "providers": [p.model_dump() for p in parent_agent.provider.providers],
+        "tools_config": parent_agent.tools_config.model_dump(),
+    }
+
+    with tempfile.TemporaryDirectory(prefix="capybara-child-") as tmp_dir:
+        request_path = Path(tmp_dir) / "request.json"
+        output_path = Path(tmp_dir) / "output.json"
+        request_path.write_text(json.dumps(request), encoding="utf-8")
+
+        process = await asyncio.create_subprocess_exec(
+            sys.executable,
+            "-m",
+            __name__,
+            str(request_path),
+            str(output_path),
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+
+        try:
+            async with async_timeout(timeout):
+                _, stderr = await process.communicate()
+        except BaseException:
+            # Timeout or cancellation: don't leave the child running
+            try:
+                process.kill()
+            except ProcessLookupError:
+                pass
+            await process.wait()
+            raise
+
+        if not output_path.exists():
+            detail = stderr.decode("utf-8", errors="replace").strip()[-500:]
+            return ChildProcessResult(
+                response="",
+                messages=[],
+                execution_log=None,
+                error=f"Child process exited with code {process.returncode}: {detail}",
+            )
+
+        output = json.loads(output_path.read_text(encoding="utf-8"))
+
+    execution_log = output.get("execution_log")
+    return ChildProcessResult(
+        response=output.get("response", ""),
+        messages=output.get("messages", []),
+        execution_log=ExecutionLog.from_dict(execution_log) if execution_log else None,
+        error=output.get("error"),
+    )
+
+
+async def _run_request(request: dict[str, Any]) -> dict[str, Any]:
+    """Build the child agent from a request and run its task."""
+    from capybara.core.config import ProviderConfig, ToolsConfig
+    from capybara.providers.router import ProviderRouter
+    from capybara.tools.builtin.delegation.agent_setup import build_child_agent
+
+    provider = ProviderRouter(
+        providers=[ProviderConfig(**p) for p in request["providers"]],
+        default_model=request["model"],
+    )
+    child_agent = build_child_agent(
+        model=request["model"],
+        provider=provider,
+        tools_config=ToolsConfig(**request["tools_config"]),
+        child_session_id=request["child_session_id"],
+        parent_session_id=request["parent_session_id"],
+        timeout=request["timeout"],
+    )
+
+    try:
+        response = await child_agent.run(request["task"])
+    except Exception as e:
+        # Exception types don't cross the process boundary; keep name and message
+        return {
+            "error": f"{type(e).__name__}: {e}",
+            "execution_log": child_agent.execution_log.to_dict()
+            if child_agent.execution_log
+            else None,
+        }
+
+    return {
+        "response": response,
+        "messages": child_agent.memory.get_messages(),
+        "execution_log": child_agent.execution_log.to_dict() if child_agent.execution_log else None,
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Child process entry point: ``child_runner <request.json> <output.json>``."""
+    request_path, output_path = argv if argv is not None else sys.argv[1:]
+    request = json.loads(Path(request_path).read_text(encoding="utf-8"))
+    output = asyncio.run(_run_request(request))
+    Path(output_path).write_text(json.dumps(output, default=str), encoding="utf-8")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
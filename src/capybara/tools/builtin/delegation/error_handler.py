@@ -3,7 +3,8 @@
 import time
 
 from capybara.core.agent import Agent
-from capybara.core.logging import log_delegation
+from capybara.core.execution.execution_log import ExecutionLog
+from capybara.core.logging import log_delegation, log_error
 from capybara.memory.storage import ConversationStorage
 from capybara.tools.builtin.delegation.failure_analysis import (
     analyze_exception_failure,
@@ -12,7 +13,7 @@ from capybara.tools.builtin.delegation.failure_analysis import (
 
 
 async def handle_timeout_error(
-    child_agent: Agent,
+    execution_log: ExecutionLog | None,
     child_session_id: str,
     parent_agent: Agent,
     parent_session_id: str,
@@ -25,14 +26,13 @@ async def handle_timeout_error(
 
     # Update parent state
     if parent_agent.flow_renderer:
-        if child_session_id in parent_agent.status.child_sessions:
-            parent_agent.status.child_sessions.remove(child_session_id)
+        parent_agent.status.child_sessions.discard(child_session_id)
 
     # Analyze failure
     failure = analyze_timeout_failure(
-        child_agent=child_agent,
+        exec_log=execution_log,
         session_id=child_session_id,
-        duration=time.time() - start_time,
+        duration=time.monotonic() - start_time,
         timeout=timeout,
         prompt=task,
     )
@@ -63,7 +63,7 @@ async def handle_timeout_error(
 
 async def handle_exception_error(
     exception: Exception,
-    child_agent: Agent,
+    execution_log: ExecutionLog | None,
     child_session_id: str,
     parent_agent: Agent,
     parent_session_id: str,
@@ -73,20 +73,16 @@ async def handle_exception_error(
 ) -> str:
     """Handle sub-agent exception error with logging and failure report."""
 
-    # Import here to avoid circular dependency
-    from capybara.core.logging import log_error
-
     # Update parent state
     if parent_agent.flow_renderer:
-        if child_session_id in parent_agent.status.child_sessions:
-            parent_agent.status.child_sessions.remove(child_session_id)
+        parent_agent.status.child_sessions.discard(child_session_id)
 
     # Analyze failure
     failure = analyze_exception_failure(
         exception=exception,
-        child_agent=child_agent,
+        exec_log=execution_log,
         session_id=child_session_id,
-        duration=time.time() - start_time,
+        duration=time.monotonic() - start_time,
         prompt=task,
     )
 
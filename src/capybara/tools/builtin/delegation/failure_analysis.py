@@ -1,28 +1,68 @@
 """Failure analysis for sub-agent execution."""
 
+import re
+
 from capybara.core.delegation.child_errors import ChildFailure, FailureCategory
+from capybara.core.execution.execution_log import ExecutionLog
+
+# Recovery actions shared across failures
+_TOOL_ERROR_ACTIONS = (
+    "Check file permissions",
+    "Verify file exists",
+    "Install missing dependencies if tool failed",
+)
+_INVALID_TASK_ACTIONS = (
+    "Clarify task requirements",
+    "Break into simpler tasks",
+    "Provide more specific instructions",
+)
+_AUTH_ACTIONS = (
+    "Check API key configuration",
+    "Verify environment variables",
+    "Check provider settings",
+)
+_GENERIC_ACTIONS = (
+    "Review error in sub-agent session logs",
+    "Fix environment",
+    "Retry after fixing issue",
+)
+
+# (category, actions, retryable) classifications
+_Failure = tuple[FailureCategory, tuple[str, ...], bool]
+_TOOL_FAILURE: _Failure = (FailureCategory.TOOL_ERROR, _TOOL_ERROR_ACTIONS, True)
+_INVALID_TASK_FAILURE: _Failure = (FailureCategory.INVALID_TASK, _INVALID_TASK_ACTIONS, False)
+_AUTH_FAILURE: _Failure = (FailureCategory.TOOL_ERROR, _AUTH_ACTIONS, True)
+_GENERIC_FAILURE: _Failure = (FailureCategory.TOOL_ERROR, _GENERIC_ACTIONS, True)
+
+# Error message keywords in priority order
+_ERROR_TABLE: dict[str, _Failure] = {
+    "authentication": _AUTH_FAILURE,
+    "api_key": _AUTH_FAILURE,
+    "permission denied": _TOOL_FAILURE,
+    "not found": _TOOL_FAILURE,
+    "invalid": _INVALID_TASK_FAILURE,
+}
+_ERROR_PATTERN = re.compile("|".join(map(re.escape, _ERROR_TABLE)), re.IGNORECASE)
 
 
 def analyze_timeout_failure(
-    child_agent, session_id: str, duration: float, timeout: float, prompt: str
+    exec_log: ExecutionLog | None, session_id: str, duration: float, timeout: float, prompt: str
 ) -> ChildFailure:
     """Analyze timeout to provide recovery guidance."""
-    exec_log = child_agent.execution_log
 
     # Extract completed work
     completed_steps = []
     if exec_log and exec_log.tool_executions:
-        successful_writes = [
-            te for te in exec_log.tool_executions if te.tool_name == "write_file" and te.success
-        ]
-        if successful_writes:
-            completed_steps.append(f"Created {len(successful_writes)} files")
+        successful_writes = successful_edits = 0
+        for te in exec_log.tool_executions:
+            if te.success:
+                successful_writes += te.tool_name == "write_file"
+                successful_edits += te.tool_name == "edit_file"
 
-        successful_edits = [
-            te for te in exec_log.tool_executions if te.tool_name == "edit_file" and te.success
-        ]
+        if successful_writes:
+            completed_steps.append(f"Created {successful_writes} files")
         if successful_edits:
-            completed_steps.append(f"Modified {len(successful_edits)} files")
+            completed_steps.append(f"Modified {successful_edits} files")
 
     tool_count = len(exec_log.tool_executions) if exec_log else 0
     needs_more_time = tool_count > 0
@@ -40,7 +80,7 @@ def analyze_timeout_failure(
         session_id=session_id,
         duration=duration,
         completed_steps=completed_steps,
-        files_modified=list(exec_log.files_modified) if exec_log else [],
+        files_modified=exec_log.files_modified if exec_log else (),
         blocked_on="Time limit insufficient",
         suggested_retry=needs_more_time,
         suggested_actions=suggested_actions,
@@ -52,61 +92,25 @@ def analyze_timeout_failure(
 
 
 def analyze_exception_failure(
-    exception: Exception, child_agent, session_id: str, duration: float, prompt: str
+    exception: Exception,
+    exec_log: ExecutionLog | None,
+    session_id: str,
+    duration: float,
+    prompt: str,
 ) -> ChildFailure:
     """Categorize exception and provide recovery guidance."""
-    exec_log = child_agent.execution_log
     error_msg = str(exception)
 
     # Check exception type first (more reliable than string matching)
     if isinstance(exception, PermissionError | FileNotFoundError | OSError | IOError):
-        category = FailureCategory.TOOL_ERROR
-        actions = [
-            "Check file permissions",
-            "Verify file exists",
-            "Install missing dependencies if tool failed",
-        ]
-        retryable = True
+        category, actions, retryable = _TOOL_FAILURE
     elif isinstance(exception, ValueError | TypeError | KeyError | AttributeError):
-        category = FailureCategory.INVALID_TASK
-        actions = [
-            "Clarify task requirements",
-            "Break into simpler tasks",
-            "Provide more specific instructions",
-        ]
-        retryable = False
-    elif "authentication" in error_msg.lower() or "api_key" in error_msg.lower():
-        category = FailureCategory.TOOL_ERROR
-        actions = [
-            "Check API key configuration",
-            "Verify environment variables",
-            "Check provider settings",
-        ]
-        retryable = True
-    elif "permission denied" in error_msg.lower() or "not found" in error_msg.lower():
-        category = FailureCategory.TOOL_ERROR
-        actions = [
-            "Check file permissions",
-            "Verify file exists",
-            "Install missing dependencies if tool failed",
-        ]
-        retryable = True
-    elif "invalid" in error_msg.lower():
-        category = FailureCategory.INVALID_TASK
-        actions = [
-            "Clarify task requirements",
-            "Break into simpler tasks",
-            "Provide more specific instructions",
-        ]
-        retryable = False
+        category, actions, retryable = _INVALID_TASK_FAILURE
     else:
-        category = FailureCategory.TOOL_ERROR
-        actions = [
-            "Review error in sub-agent session logs",
-            "Fix environment",
-            "Retry after fixing issue",
-        ]
-        retryable = True
+        # Single scan of the message; highest-priority keyword wins
+        found = {m.lower() for m in _ERROR_PATTERN.findall(error_msg)}
+        keyword = next((k for k in _ERROR_TABLE if k in found), None)
+        category, actions, retryable = _ERROR_TABLE[keyword] if keyword else _GENERIC_FAILURE
 
     return ChildFailure(
         category=category,
@@ -114,7 +118,7 @@ def analyze_exception_failure(
         session_id=session_id,
         duration=duration,
         completed_steps=[],
-        files_modified=list(exec_log.files_modified) if exec_log else [],
+        files_modified=exec_log.files_modified if exec_log else (),
         blocked_on=error_msg,
         suggested_retry=retryable,
         suggested_actions=actions,
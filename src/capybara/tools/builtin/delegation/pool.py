@@ -0,0 +1,133 @@
+"""Pool of reusable sub-agent instances."""
+
+import asyncio
+import time
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+
+from capybara.core.agent import Agent
+from capybara.tools.builtin.delegation.agent_setup import create_child_memory, create_sub_agent
+
+
+@dataclass
+class AgentPoolEntry:
+    """Pooled sub-agent with usage tracking."""
+
+    agent: Agent
+    key: tuple[int, int, str]
+    in_use: bool = False
+    last_used: float = field(default_factory=time.monotonic)
+    usage_count: int = 0
+
+
+class ChildAgentPool:
+    """Reuses sub-agents across delegations instead of constructing one per task.
+
+    Agents are keyed by the parent's provider, tools config and model, so a
+    pooled child always inherits the same API keys and permissions it would
+    have been created with. Idle agents are evicted after idle_timeout seconds.
+    When every pooled agent is busy and the pool is full, a one-off agent is
+    created and discarded after use.
+    """
+
+    def __init__(self, max_size: int = 10, idle_timeout: float = 300.0) -> None:
+        """Initialize agent pool.
+
+        Args:
+            max_size: Maximum number of pooled agents
+            idle_timeout: Seconds an unused agent stays pooled
+        """
+        self.max_size = max_size
+        self.idle_timeout = idle_timeout
+        self._entries: list[AgentPoolEntry] = []
+        self._lock = asyncio.Lock()
+
+    @asynccontextmanager
+    async def acquire(
+        self,
+        parent_agent: Agent,
+        child_session_id: str,
+        parent_session_id: str,
+        timeout: float,
+    ) -> AsyncIterator[Agent]:
+        """Check out a sub-agent bound to a fresh child session.
+
+        Args:
+            parent_agent: Parent agent to inherit provider/config from
+            child_session_id: Session ID for child
+            parent_session_id: Parent's session ID for logging
+            timeout: Max execution time
+
+        Yields:
+            Sub-agent with empty memory, ready for execution
+        """
+        entry = await self._checkout(parent_agent, child_session_id, parent_session_id, timeout)
+        try:
+            yield entry.agent
+        finally:
+            entry.in_use = False
+            entry.last_used = time.monotonic()
+
+    async def _checkout(
+        self,
+        parent_agent: Agent,
+        child_session_id: str,
+        parent_session_id: str,
+        timeout: float,
+    ) -> AgentPoolEntry:
+        """Reuse an idle matching agent, or create a new one."""
+        key = (
+            id(parent_agent.provider),
+            id(parent_agent.tools_config),
+            parent_agent.config.model,
+        )
+
+        async with self._lock:
+            self._evict_idle()
+
+            for entry in self._entries:
+                if not entry.in_use and entry.key == key:
+                    entry.in_use = True
+                    entry.usage_count += 1
+                    entry.agent.reset(
+                        memory=create_child_memory(),
+                        session_id=child_session_id,
+                        parent_session_id=parent_session_id,
+                    )
+                    entry.agent.config.timeout = timeout
+                    return entry
+
+            entry = AgentPoolEntry(
+                agent=create_sub_agent(
+                    parent_agent=parent_agent,
+                    child_session_id=child_session_id,
+                    parent_session_id=parent_session_id,
+                    timeout=timeout,
+                ),
+                key=key,
+                in_use=True,
+                usage_count=1,
+            )
+            if len(self._entries) < self.max_size:
+                self._entries.append(entry)
+            return entry
+
+    def _evict_idle(self) -> None:
+        """Drop agents unused for longer than idle_timeout."""
+        now = time.monotonic()
+        self._entries = [
+            e for e in self._entries if e.in_use or now - e.last_used < self.idle_timeout
+        ]
+
+
+# Global pool shared by all sub_agent tool registrations
+_child_pool: ChildAgentPool | None = None
+
+
+def get_child_agent_pool() -> ChildAgentPool:
+    """Get or create global sub-agent pool."""
+    global _child_pool
+    if _child_pool is None:
+        _child_pool = ChildAgentPool()
+    return _child_pool
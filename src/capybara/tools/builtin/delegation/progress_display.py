@@ -1,16 +1,103 @@
 """Progress display for sub-agent execution."""
 
+import asyncio
 import time
+import weakref
+from collections import deque
+from collections.abc import Callable
 from typing import Any
 
-from rich.console import Group
+from rich.console import Console, Group
 from rich.live import Live
 from rich.spinner import Spinner
+from rich.style import Style
 from rich.text import Text
 
 from capybara.core.agent import Agent
 from capybara.core.agent.status import AgentState, AgentStatus
-from capybara.core.delegation.event_bus import EventType, get_event_bus
+from capybara.core.delegation.event_bus import Event, EventType, get_event_bus
+
+# Frames per second for the Live display; events are picked up on the next frame.
+# Render time is subtracted from the frame interval, and the display drops to
+# the idle rate while no events arrive.
+_REFRESH_PER_SECOND = 4
+_IDLE_REFRESH_PER_SECOND = 2
+_IDLE_AFTER = 1.0
+_MIN_REFRESH_INTERVAL = 0.02
+
+# Prebuilt styles and box pieces, so per-event lines skip the markup parser
+_DIM = Style(dim=True)
+_BOX_STYLE = Style(color="cyan", bold=True)
+_PREFIX = Text("│ ", style=_BOX_STYLE)
+_BOX_SIDE = Text("│", style=_BOX_STYLE)
+_BOX_TOP = Text(
+    "\n╭──────────────────────────── SubAgent ─────────────────────────────╮", style=_BOX_STYLE
+)
+_BOX_BOTTOM = Text(
+    "╰────────────────────────────────────────────────────────────────────╮\n", style=_BOX_STYLE
+)
+
+
+class _ConsoleBatcher:
+    """Coalesce markup lines into a single console write per flush interval.
+
+    Concurrent sub-agents share one batcher per console, so sibling status
+    lines that arrive together are rendered and written in one print call.
+    """
+
+    def __init__(self, console: Console, interval: float = 0.05) -> None:
+        self.console = console
+        self.interval = interval
+        self._buf: list[str] = []
+        self._flush_task: asyncio.Task[None] | None = None
+
+    def add(self, markup: str) -> None:
+        """Queue a markup line and schedule a flush if none is pending."""
+        self._buf.append(markup)
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def _flush_later(self) -> None:
+        await asyncio.sleep(self.interval)
+        self.flush()
+
+    def flush(self) -> None:
+        """Write all queued lines now."""
+        if self._buf:
+            self.console.print("\n".join(self._buf))
+            self._buf.clear()
+
+
+_batchers: weakref.WeakKeyDictionary[Console, _ConsoleBatcher] = weakref.WeakKeyDictionary()
+
+
+def _get_batcher(console: Console) -> _ConsoleBatcher:
+    """Get the shared batcher for a console."""
+    batcher = _batchers.get(console)
+    if batcher is None:
+        batcher = _batchers[console] = _ConsoleBatcher(console)
+    return batcher
+
+
+async def _refresh_live(live: Live, last_event: list[float]) -> None:
+    """Refresh a Live display at an adaptive rate until cancelled.
+
+    Args:
+        live: Live display started with auto_refresh=False
+        last_event: One-element list holding the monotonic time of the last event
+    """
+    durations: deque[float] = deque(maxlen=10)
+    while True:
+        start = time.monotonic()
+        live.refresh()
+        durations.append(time.monotonic() - start)
+
+        if start - last_event[0] > _IDLE_AFTER:
+            interval = 1 / _IDLE_REFRESH_PER_SECOND
+        else:
+            mean_duration = sum(durations) / len(durations)
+            interval = max(1 / _REFRESH_PER_SECOND - mean_duration, _MIN_REFRESH_INTERVAL)
+        await asyncio.sleep(interval)
 
 
 def _format_tool_args(args: dict[str, Any]) -> str:
@@ -25,18 +112,18 @@ def _format_tool_args(args: dict[str, Any]) -> str:
     if not args:
         return ""
 
-    display_args = []
+    parts = []
     for k, v in args.items():
-        v_str = str(v)
+        # JSON-decoded args are exact types, so skip the isinstance MRO walk
+        is_str = type(v) is str
+        s = v if is_str else str(v)
         # Truncate long values
-        if len(v_str) > 100:
-            v_str = v_str[:100] + "..."
+        if len(s) > 100:
+            s = s[:100] + "..."
         # Quote string values
-        if isinstance(v, str):
-            v_str = f"'{v_str}'"
-        display_args.append(f"{k}={v_str}")
+        parts.append(f"{k}='{s}'" if is_str else f"{k}={s}")
 
-    return ", ".join(display_args)
+    return ", ".join(parts)
 
 
 async def display_sub_agent_progress(
@@ -51,19 +138,25 @@ async def display_sub_agent_progress(
     - Closing box symbol
 
     Does NOT spam console with per-tool output or status panels.
+    Falls back to start/finish lines when the console isn't a terminal.
     """
-    task_start = time.time()
+    # Headless output (CI logs, pipes) can't animate; skip the Live display
+    if not parent_agent.console.is_terminal:
+        await display_sub_agent_progress_plain(parent_agent, child_session_id, task)
+        return
+
+    task_start = time.monotonic()
     event_bus = get_event_bus()
 
-    # Render static header (outside Live to avoid flickering)
-    parent_agent.console.print(
-        "\n[bold cyan]╭──────────────────────────── SubAgent ─────────────────────────────╮[/bold cyan]"
-    )
-    parent_agent.console.print(f"[bold cyan]│[/bold cyan] [dim]Task: {task[:62]}...[/dim]")
+    # Render static header (outside Live to avoid flickering) in a single write
     parent_agent.console.print(
-        f"[bold cyan]│[/bold cyan] ⚙️  Autonomous execution (timeout: {timeout}s)"
+        Group(
+            _BOX_TOP,
+            Text.assemble(_PREFIX, (f"Task: {task[:62]}...", _DIM)),
+            Text.assemble(_PREFIX, f"⚙️  Autonomous execution (timeout: {timeout}s)"),
+            _BOX_SIDE,
+        )
     )
-    parent_agent.console.print("[bold cyan]│[/bold cyan]")
 
     # Track child status in flow renderer
     if parent_agent.flow_renderer:
@@ -75,104 +168,150 @@ async def display_sub_agent_progress(
         )
         parent_agent.flow_renderer.update_child(child_session_id, child_status)
 
-    # Track display state
+    # Track display state. The Live renderable is a single Group whose lines are
+    # appended in place; the spinner row, when shown, is always the last line.
     tool_count = 0
+    progress = Group()
+    tool_lines = progress.renderables
+    thinking_row = Group(
+        _PREFIX,
+        Spinner("dots", text="Thinking...", style="cyan"),
+    )
+    tool_lines.append(thinking_row)
     is_thinking = True
-    tool_lines: list[Text] = []  # Accumulated tool execution lines
 
-    def render_progress():
-        """Build current progress display with spinner if thinking."""
-        lines: list[Text | Group] = []
-
-        # Add accumulated tool lines
-        for line in tool_lines:
-            lines.append(line)
-
-        # Add spinner if thinking
-        if is_thinking:
-            lines.append(
-                Group(
-                    Text("│ ", style="bold cyan"), Spinner("dots", text="Thinking...", style="cyan")
-                )
+    def set_thinking(thinking: bool) -> None:
+        """Show or hide the spinner row."""
+        nonlocal is_thinking
+        if thinking == is_thinking:
+            return
+        if thinking:
+            tool_lines.append(thinking_row)
+        else:
+            tool_lines.pop()
+        is_thinking = thinking
+
+    def on_state_change(event: Event) -> None:
+        # Update flow renderer but DON'T print internal state messages
+        new_state = AgentState(event.agent_state)
+
+        # Update thinking state
+        if new_state == AgentState.THINKING:
+            set_thinking(True)
+        elif new_state == AgentState.EXECUTING_TOOLS:
+            set_thinking(False)
+
+        if parent_agent.flow_renderer:
+            child_status.state = new_state
+            child_status.current_action = event.message
+            parent_agent.flow_renderer.update_child(child_session_id, child_status)
+
+    def on_tool_start(event: Event) -> None:
+        nonlocal tool_count
+        tool_count += 1
+        tool_name = event.tool_name or "unknown"
+        tool_args = event.metadata.get("args", {})
+
+        # Format arguments like main agent does
+        args_display = _format_tool_args(tool_args)
+        tool_line = Text.assemble(_PREFIX, (f"> {tool_name}({args_display})", _DIM))
+        set_thinking(False)
+        tool_lines.append(tool_line)
+
+    def on_done(event: Event) -> None:
+        elapsed = time.monotonic() - task_start
+        status = event.metadata.get("status", "completed")
+
+        # Clear thinking state
+        set_thinking(False)
+
+        # Add final status line
+        if status == "completed":
+            status_line = Text.assemble(
+                _PREFIX,
+                (f"✅ Work completed in {elapsed:.1f}s ({tool_count} tools used)", "green"),
             )
-
-        return Group(*lines) if lines else Text("")
-
-    # Use Live display for animated spinner
+        else:
+            error_msg = event.metadata.get("error", status)
+            status_line = Text.assemble(_PREFIX, (f"❌ Work failed: {error_msg}", "red"))
+
+        tool_lines.append(status_line)
+
+    # The subscription ends after AGENT_DONE
+    handlers: dict[EventType, Callable[[Event], None]] = {
+        EventType.AGENT_STATE_CHANGE: on_state_change,
+        EventType.TOOL_START: on_tool_start,
+        EventType.AGENT_DONE: on_done,
+    }
+
+    # Use Live display for animated spinner. Handlers mutate the Group in place
+    # and the refresh task renders it once per frame, however many events arrived.
+    last_event = [time.monotonic()]
     with Live(
-        render_progress(),
+        progress,
         console=parent_agent.console,
-        refresh_per_second=20,
+        auto_refresh=False,
         transient=True,
         vertical_overflow="visible",
     ) as live:
-        async for event in event_bus.subscribe(child_session_id):
-            if event.event_type == EventType.AGENT_STATE_CHANGE:
-                # Update flow renderer but DON'T print internal state messages
-                new_state = AgentState(event.agent_state)
-
-                # Update thinking state
-                if new_state == AgentState.THINKING:
-                    is_thinking = True
-                elif new_state == AgentState.EXECUTING_TOOLS:
-                    is_thinking = False
-
-                if parent_agent.flow_renderer:
-                    child_status.state = new_state
-                    child_status.current_action = event.message
-                    parent_agent.flow_renderer.update_child(child_session_id, child_status)
-
-                # Update Live display
-                live.update(render_progress())
-
-            elif event.event_type == EventType.TOOL_START:
-                tool_count += 1
-                tool_name = event.tool_name or "unknown"
-                tool_args = event.metadata.get("args", {})
-
-                # Format arguments like main agent does
-                args_display = _format_tool_args(tool_args)
-                tool_line = Text.from_markup(
-                    f"[bold cyan]│[/bold cyan] [dim]> {tool_name}({args_display})[/dim]"
-                )
-                tool_lines.append(tool_line)
-                is_thinking = False
-
-                # Update Live display
-                live.update(render_progress())
-
-            elif event.event_type == EventType.AGENT_DONE:
-                elapsed = time.time() - task_start
-                status = event.metadata.get("status", "completed")
-
-                # Clear thinking state
-                is_thinking = False
-
-                # Add final status line
-                if status == "completed":
-                    status_line = Text.from_markup(
-                        f"[bold cyan]│[/bold cyan] [green]✅ Work completed in {elapsed:.1f}s ({tool_count} tools used)[/green]"
-                    )
-                else:
-                    error_msg = event.metadata.get("error", status)
-                    status_line = Text.from_markup(
-                        f"[bold cyan]│[/bold cyan] [red]❌ Work failed: {error_msg}[/red]"
-                    )
-
-                tool_lines.append(status_line)
-                live.update(render_progress())
-                break
+        refresh_task = asyncio.create_task(_refresh_live(live, last_event))
+        try:
+            async for batch in event_bus.subscribe_batched(child_session_id, types=set(handlers)):
+                last_event[0] = time.monotonic()
+                for event in batch:
+                    handler = handlers.get(event.event_type)
+                    if handler is not None:
+                        handler(event)
+        finally:
+            refresh_task.cancel()
+
+    set_thinking(False)
 
     # After Live context ends, print all accumulated lines permanently
-    # (Live was transient, so everything disappeared - reprint for history)
-    for line in tool_lines:
-        parent_agent.console.print(line)
-
-    # Print closing box
-    parent_agent.console.print(
-        "[bold cyan]╰────────────────────────────────────────────────────────────────────╮[/bold cyan]\n"
-    )
+    # (Live was transient, so everything disappeared - reprint for history),
+    # followed by the closing box, in one print call
+    parent_agent.console.print(Group(*tool_lines, _BOX_BOTTOM))
 
     # Cleanup flow renderer
     if parent_agent.flow_renderer:
         parent_agent.flow_renderer.remove_child(child_session_id)
+
+
+async def display_sub_agent_progress_plain(
+    parent_agent: Agent, child_session_id: str, task: str
+) -> None:
+    """Display sub-agent progress as a start line and a final status line.
+
+    Used when several sub-agents run concurrently: Rich allows only one Live
+    display per console, so per-tool lines and the spinner are skipped.
+    """
+    task_start = time.monotonic()
+    event_bus = get_event_bus()
+    short_id = child_session_id[:8]
+    batcher = _get_batcher(parent_agent.console)
+
+    batcher.add(f"[bold cyan]⚙️  SubAgent {short_id}[/bold cyan] [dim]{task[:62]}...[/dim]")
+
+    tool_count = 0
+    async for event in event_bus.subscribe(child_session_id, types={EventType.TOOL_START}):
+        if event.event_type == EventType.TOOL_START:
+            tool_count += 1
+
+        elif event.event_type == EventType.AGENT_DONE:
+            elapsed = time.monotonic() - task_start
+            status = event.metadata.get("status", "completed")
+
+            if status == "completed":
+                batcher.add(
+                    f"[bold cyan]⚙️  SubAgent {short_id}[/bold cyan] "
+                    f"[green]✅ Work completed in {elapsed:.1f}s ({tool_count} tools used)[/green]"
+                )
+            else:
+                error_msg = event.metadata.get("error", status)
+                batcher.add(
+                    f"[bold cyan]⚙️  SubAgent {short_id}[/bold cyan] "
+                    f"[red]❌ Work failed: {error_msg}[/red]"
+                )
+            # Final line must be visible before the tool result returns
+            batcher.flush()
+            break
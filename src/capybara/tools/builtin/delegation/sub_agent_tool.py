@@ -1,23 +1,32 @@
 """Sub-agent tool for delegating autonomous work."""
 
+from __future__ import annotations
+
 import asyncio
+import sys
 import time
+from typing import TYPE_CHECKING, Any
 
-from capybara.core.agent import Agent
 from capybara.core.agent.status import AgentState
-from capybara.core.delegation.session_manager import SessionManager
+from capybara.core.delegation.child_errors import ChildFailure, FailureCategory
 from capybara.core.logging import log_delegation
-from capybara.memory.storage import ConversationStorage
 from capybara.tools.base import AgentMode
-from capybara.tools.builtin.delegation.agent_setup import create_sub_agent
-from capybara.tools.builtin.delegation.error_handler import (
-    handle_exception_error,
-    handle_timeout_error,
-)
-from capybara.tools.builtin.delegation.progress_display import display_sub_agent_progress
-from capybara.tools.builtin.delegation.success_handler import handle_success
 from capybara.tools.registry import ToolRegistry
 
+if TYPE_CHECKING:
+    from capybara.core.agent import Agent
+    from capybara.core.delegation.session_manager import SessionManager
+    from capybara.core.execution.execution_log import ExecutionLog
+    from capybara.memory.storage import ConversationStorage
+
+if sys.version_info >= (3, 11):
+    from asyncio import timeout as async_timeout
+else:
+    from async_timeout import timeout as async_timeout
+
+# Seconds to let the progress display print its final lines after the child returns
+_DISPLAY_GRACE_PERIOD = 5.0
+
 
 async def execute_sub_agent(
     task: str,
@@ -26,6 +35,8 @@ async def execute_sub_agent(
     session_manager: SessionManager,
     storage: ConversationStorage,
     timeout: float = 180.0,
+    live_display: bool = True,
+    subprocess_mode: bool = False,
 ) -> str:
     """Execute sub-agent to complete autonomous work task.
 
@@ -40,6 +51,10 @@ async def execute_sub_agent(
         session_manager: Session manager for hierarchy
         storage: Storage for persistence
         timeout: Max execution time in seconds (default: 180s / 3min)
+        live_display: Show animated Live progress (disable when running sub-agents
+            concurrently, since only one Live display can be active per console)
+        subprocess_mode: Run the sub-agent in a separate Python process instead of
+            the parent's event loop (no progress display; see child_runner)
 
     Returns:
         Comprehensive work report including:
@@ -50,36 +65,44 @@ async def execute_sub_agent(
         - Success rate
     """
 
-    start_time = time.time()
+    # Execution-only modules (pool, progress display, handlers) are imported on
+    # first delegation so registering the tool stays cheap for parents that never use it
+    from capybara.tools.builtin.delegation.error_handler import (
+        handle_exception_error,
+        handle_timeout_error,
+    )
+    from capybara.tools.builtin.delegation.pool import get_child_agent_pool
+    from capybara.tools.builtin.delegation.progress_display import (
+        display_sub_agent_progress,
+        display_sub_agent_progress_plain,
+    )
+    from capybara.tools.builtin.delegation.success_handler import handle_success
+
+    start_time = time.monotonic()
+    # Shared prefix for titles, status, logs and progress displays (slicing it avoids
+    # re-slicing a long task)
+    task_100 = task[:100]
 
     # Create child session
     child_session_id = await session_manager.create_child_session(
         parent_id=parent_session_id,
         model=parent_agent.config.model,
         prompt=task,
-        title=f"Subtask: {task[:50]}...",
-    )
-
-    # Create configured sub-agent (inherits parent's provider/API keys)
-    child_agent = create_sub_agent(
-        parent_agent=parent_agent,
-        child_session_id=child_session_id,
-        parent_session_id=parent_session_id,
-        timeout=timeout,
+        title=f"Subtask: {task_100[:50]}...",
     )
 
     # Update parent state
     if parent_agent.flow_renderer:
         parent_agent._update_state(
-            AgentState.WAITING_FOR_CHILD, f"Sub-agent working: {task[:40]}..."
+            AgentState.WAITING_FOR_CHILD, f"Sub-agent working: {task_100[:40]}..."
         )
-        parent_agent.status.child_sessions.append(child_session_id)
+        parent_agent.status.child_sessions.add(child_session_id)
 
     # Log delegation start
     await storage.log_session_event(
         session_id=parent_session_id,
         event_type="delegation_start",
-        metadata={"child_session_id": child_session_id, "task": task[:100]},
+        metadata={"child_session_id": child_session_id, "task": task_100},
     )
 
     if parent_agent.session_logger:
@@ -88,39 +111,86 @@ async def execute_sub_agent(
             action="start",
             parent_session=parent_session_id,
             child_session=child_session_id,
-            prompt=task[:100],
+            prompt=task_100,
         )
 
+    execution_log: ExecutionLog | None = None
     try:
-        # Execute sub-agent and display progress concurrently
-        response, _ = await asyncio.wait_for(
-            asyncio.gather(
-                child_agent.run(task),
-                display_sub_agent_progress(
-                    parent_agent=parent_agent,
-                    child_session_id=child_session_id,
-                    task=task,
-                    timeout=timeout,
-                    parent_session_id=parent_session_id,
-                ),
-            ),
-            timeout=timeout,
-        )
+        if subprocess_mode:
+            from capybara.tools.builtin.delegation.child_runner import run_child_process
+
+            result = await run_child_process(
+                task=task,
+                parent_agent=parent_agent,
+                child_session_id=child_session_id,
+                parent_session_id=parent_session_id,
+                timeout=timeout,
+            )
+            execution_log = result.execution_log
+            if result.error:
+                raise RuntimeError(result.error)
+            response, messages = result.response, result.messages
+
+        else:
+            # Check out a configured sub-agent (inherits parent's provider/API keys)
+            async with get_child_agent_pool().acquire(
+                parent_agent=parent_agent,
+                child_session_id=child_session_id,
+                parent_session_id=parent_session_id,
+                timeout=timeout,
+            ) as child_agent:
+                execution_log = child_agent.execution_log
+
+                # Execute sub-agent and display progress concurrently
+                if live_display:
+                    progress = display_sub_agent_progress(
+                        parent_agent=parent_agent,
+                        child_session_id=child_session_id,
+                        task=task_100,
+                        timeout=timeout,
+                        parent_session_id=parent_session_id,
+                    )
+                else:
+                    progress = display_sub_agent_progress_plain(
+                        parent_agent=parent_agent,
+                        child_session_id=child_session_id,
+                        task=task_100,
+                    )
+
+                # The display runs alongside and ends on the child's AGENT_DONE;
+                # only the child itself is bound by the timeout
+                display_task = asyncio.create_task(progress)
+                try:
+                    async with async_timeout(timeout):
+                        response = await child_agent.run(task)
+                    await asyncio.wait({display_task}, timeout=_DISPLAY_GRACE_PERIOD)
+                finally:
+                    if not display_task.done():
+                        display_task.cancel()
+                    elif not display_task.cancelled():
+                        # Display failures shouldn't fail the delegation; just log them
+                        display_error = display_task.exception()
+                        if display_error and parent_agent.session_logger:
+                            parent_agent.session_logger.warning(
+                                f"Sub-agent progress display failed: {display_error}"
+                            )
+                messages = child_agent.memory.get_messages()
 
         # Handle successful execution
         return await handle_success(
             response=response,
-            child_agent=child_agent,
+            messages=messages,
+            execution_log=execution_log,
             child_session_id=child_session_id,
             parent_agent=parent_agent,
             parent_session_id=parent_session_id,
             storage=storage,
-            duration=time.time() - start_time,
+            duration=time.monotonic() - start_time,
         )
 
     except asyncio.TimeoutError:
         return await handle_timeout_error(
-            child_agent=child_agent,
+            execution_log=execution_log,
             child_session_id=child_session_id,
             parent_agent=parent_agent,
             parent_session_id=parent_session_id,
@@ -133,7 +203,7 @@ async def execute_sub_agent(
     except Exception as e:
         return await handle_exception_error(
             exception=e,
-            child_agent=child_agent,
+            execution_log=execution_log,
             child_session_id=child_session_id,
             parent_agent=parent_agent,
             parent_session_id=parent_session_id,
@@ -143,6 +213,26 @@ async def execute_sub_agent(
         )
 
 
+def _reject_nested_delegation(session_id: str) -> str:
+    """Failure report for delegation attempted outside PARENT mode."""
+    return ChildFailure(
+        category=FailureCategory.INVALID_TASK,
+        message=(
+            "Delegation from CHILD mode is not permitted; perform the work directly "
+            "or request sibling sub_agents from the parent."
+        ),
+        session_id=session_id,
+        duration=0.0,
+        completed_steps=[],
+        files_modified=(),
+        blocked_on=None,
+        suggested_retry=False,
+        suggested_actions=("Perform the work directly with your own tools",),
+        tool_usage={},
+        last_successful_tool=None,
+    ).to_context_string()
+
+
 def register_sub_agent_tool(
     registry: ToolRegistry,
     parent_session_id: str,
@@ -189,6 +279,10 @@ def register_sub_agent_tool(
     )
     async def sub_agent(task: str, timeout: float = 180.0) -> str:
         """Execute sub-agent for autonomous work task."""
+        # Refuse nested delegation before creating a child session
+        if parent_agent.config.mode != AgentMode.PARENT:
+            return _reject_nested_delegation(parent_session_id)
+
         return await execute_sub_agent(
             task=task,
             parent_session_id=parent_session_id,
@@ -196,4 +290,72 @@ def register_sub_agent_tool(
             session_manager=session_manager,
             storage=storage,
             timeout=timeout,
+            subprocess_mode=parent_agent.tools_config.sub_agent_subprocess,
+        )
+
+    @registry.tool(
+        name="sub_agents",
+        description=(
+            "Delegate several independent tasks to sub-agents that run in parallel. "
+            "Use instead of repeated sub_agent calls when tasks don't depend on each other "
+            "and don't edit the same files. Returns one work report per task, in order."
+        ),
+        parameters={
+            "type": "object",
+            "properties": {
+                "tasks": {
+                    "type": "array",
+                    "description": "Independent tasks to run concurrently",
+                    "items": {
+                        "type": "object",
+                        "properties": {
+                            "task": {
+                                "type": "string",
+                                "description": (
+                                    "Comprehensive task description with all necessary context "
+                                    "(same requirements as sub_agent's task)"
+                                ),
+                            },
+                            "timeout": {
+                                "type": "number",
+                                "description": "Maximum execution time in seconds (default: 180s)",
+                                "default": 180.0,
+                            },
+                        },
+                        "required": ["task"],
+                    },
+                    "minItems": 1,
+                },
+            },
+            "required": ["tasks"],
+        },
+        allowed_modes=[AgentMode.PARENT],
+    )
+    async def sub_agents(tasks: list[dict[str, Any]]) -> str:
+        """Execute independent sub-agent tasks concurrently."""
+        if parent_agent.config.mode != AgentMode.PARENT:
+            return _reject_nested_delegation(parent_session_id)
+
+        results = await asyncio.gather(
+            *(
+                execute_sub_agent(
+                    task=t["task"],
+                    parent_session_id=parent_session_id,
+                    parent_agent=parent_agent,
+                    session_manager=session_manager,
+                    storage=storage,
+                    timeout=t.get("timeout", 180.0),
+                    live_display=False,
+                    subprocess_mode=parent_agent.tools_config.sub_agent_subprocess,
+                )
+                for t in tasks
+            ),
+            return_exceptions=True,
         )
+
+        sections = []
+        for index, result in enumerate(results, start=1):
+            if isinstance(result, BaseException):
+                result = f"Error: {type(result).__name__}: {result}"
+            sections.append(f'<sub_agent_result index="{index}">\n{result}\n</sub_agent_result>')
+        return "\n\n".join(sections)
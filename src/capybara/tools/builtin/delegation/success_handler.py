@@ -1,7 +1,10 @@
 """Success handling for sub-agent execution."""
 
+from typing import Any
+
 from capybara.core.agent import Agent
 from capybara.core.agent.status import AgentState
+from capybara.core.execution.execution_log import ExecutionLog
 from capybara.core.logging import log_delegation
 from capybara.memory.storage import ConversationStorage
 from capybara.tools.builtin.delegation.work_report import generate_work_report
@@ -9,7 +12,8 @@ from capybara.tools.builtin.delegation.work_report import generate_work_report
 
 async def handle_success(
     response: str,
-    child_agent: Agent,
+    messages: list[dict[str, Any]],
+    execution_log: ExecutionLog | None,
     child_session_id: str,
     parent_agent: Agent,
     parent_session_id: str,
@@ -19,12 +23,11 @@ async def handle_success(
     """Handle successful sub-agent execution with logging and work report."""
 
     # Save child messages to storage
-    for msg in child_agent.memory.get_messages():
-        await storage.save_message(child_session_id, msg)
+    await storage.save_messages(child_session_id, messages)
 
     # Update parent state
     if parent_agent.flow_renderer:
-        parent_agent.status.child_sessions.remove(child_session_id)
+        parent_agent.status.child_sessions.discard(child_session_id)
         parent_agent._update_state(AgentState.EXECUTING_TOOLS, "Processing work report")
 
     # Log completion event
@@ -51,7 +54,7 @@ async def handle_success(
     # Generate comprehensive work report
     return generate_work_report(
         response=response,
-        execution_log=child_agent.execution_log,
+        execution_log=execution_log,
         session_id=child_session_id,
         duration=duration,
     )
@@ -2,6 +2,40 @@
 
 from capybara.core.execution.execution_log import ExecutionLog
 
+_FALLBACK_TEMPLATE = """Sub-agent Work Report (Session: {session_id})
+Duration: {duration:.2f}s
+
+{response}
+
+Note: Detailed execution tracking not available."""
+
+_REPORT_TEMPLATE = """Sub-agent Work Report (Session: {session_id})
+Duration: {duration:.2f}s | Success Rate: {success_rate:.0%}
+
+Quick Summary:
+{response_summary}
+
+Files Modified ({files_modified_count}): {files_modified_list}
+Files Read ({files_read_count}): {files_read_list}
+
+Tools Used ({tool_count} total):
+{tool_summary}
+{error_section}
+---
+Parent: Use this concise report to inform your response. Don't repeat the full child response."""
+
+_TOOL_LINE = "  - {0[0]}: {0[1]}x"
+
+
+def _join_paths(paths: list[str]) -> str:
+    """Comma-join already sorted paths."""
+    return ", ".join(paths) or "none"
+
+
+def _clip(text: str, limit: int = 150) -> str:
+    """Truncate text to limit characters, marking cut text with '...'."""
+    return text if len(text) <= limit else text[:limit] + "..."
+
 
 def generate_work_report(
     response: str, execution_log: ExecutionLog | None, session_id: str, duration: float
@@ -20,47 +54,44 @@ def generate_work_report(
 
     if not execution_log:
         # Fallback for agents without execution tracking
-        return f"""Sub-agent Work Report (Session: {session_id})
-Duration: {duration:.2f}s
-
-{response}
-
-Note: Detailed execution tracking not available."""
+        return _FALLBACK_TEMPLATE.format_map(
+            {"session_id": session_id, "duration": duration, "response": response}
+        )
 
     # Build comprehensive report
-    files_modified_list = ", ".join(sorted(execution_log.files_modified)) or "none"
-    files_read_list = ", ".join(sorted(execution_log.files_read)) or "none"
+    files_modified = execution_log.sorted_files_modified()
+    files_read = execution_log.sorted_files_read()
+    files_modified_list = _join_paths(files_modified)
+    files_read_list = _join_paths(files_read)
 
-    tool_summary_lines = [
-        f"  - {tool}: {count}x" for tool, count in execution_log.tool_usage_summary.items()
-    ]
-    tool_summary = "\n".join(tool_summary_lines) if tool_summary_lines else "  (none)"
+    tool_summary = (
+        "\n".join(map(_TOOL_LINE.format, execution_log.tool_usage_summary.items())) or "  (none)"
+    )
 
     error_section = ""
-    if execution_log.errors:
-        error_lines = [
-            f"  - {tool}: {msg[:150]}{'...' if len(msg) > 150 else ''}"
-            for tool, msg in execution_log.errors
-        ]
-        error_section = f"""
-Errors Encountered ({len(execution_log.errors)}):
-{chr(10).join(error_lines)}
-"""
+    errors = execution_log.errors
+    if errors:
+        # Blank line before the header and a trailing newline, joined in one go
+        parts = ["", f"Errors Encountered ({len(errors)}):"]
+        parts.extend(f"  - {tool}: {_clip(msg)}" for tool, msg in errors)
+        parts.append("")
+        error_section = "\n".join(parts)
 
     # Extract first 300 chars of response as summary (avoid duplication in parent's output)
     response_summary = response[:300] + "..." if len(response) > 300 else response
 
-    return f"""Sub-agent Work Report (Session: {session_id})
-Duration: {duration:.2f}s | Success Rate: {execution_log.success_rate:.0%}
-
-Quick Summary:
-{response_summary}
-
-Files Modified ({len(execution_log.files_modified)}): {files_modified_list}
-Files Read ({len(execution_log.files_read)}): {files_read_list}
-
-Tools Used ({len(execution_log.tool_executions)} total):
-{tool_summary}
-{error_section}
----
-Parent: Use this concise report to inform your response. Don't repeat the full child response."""
+    return _REPORT_TEMPLATE.format_map(
+        {
+            "session_id": session_id,
+            "duration": duration,
+            "success_rate": execution_log.success_rate,
+            "response_summary": response_summary,
+            "files_modified_count": len(files_modified),
+            "files_modified_list": files_modified_list,
+            "files_read_count": len(files_read),
+            "files_read_list": files_read_list,
+            "tool_count": len(execution_log.tool_executions),
+            "tool_summary": tool_summary,
+            "error_section": error_section,
+        }
+    )
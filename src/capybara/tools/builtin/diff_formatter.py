@@ -1,13 +1,25 @@
 """Diff formatting utilities for file edit operations."""
 
 import os
+import subprocess
+import tempfile
+from collections.abc import Iterator
 from difflib import unified_diff
+from pathlib import Path
 
 # Truncation settings
 MAX_LINES_PER_TYPE = 2  # Max lines to show for additions OR deletions (total 4)
 CONTEXT_LINES_DEFAULT = 1  # Minimal context for cleaner output
 MAX_LINE_LENGTH = 60  # Truncate lines longer than this
 
+# Inputs above either limit are diffed with git's C implementation, since
+# difflib's matching goes quadratic on large files
+LARGE_DIFF_CHARS = 100_000
+LARGE_DIFF_LINES = 5000
+
+# Stripped from diff lines before display
+_LINE_ENDINGS = "\r\n"
+
 
 def _truncate_line(content: str, max_length: int) -> str:
     """Truncate a line if it exceeds max_length."""
@@ -38,49 +50,128 @@ def generate_diff(
     Returns:
         Formatted diff output with truncation for long changes
     """
-    original_lines = original.splitlines(keepends=True)
-    modified_lines = modified.splitlines(keepends=True)
-
-    # Get unified diff
-    diff = list(
-        unified_diff(
-            original_lines,
-            modified_lines,
-            fromfile=file_path,
-            tofile=file_path,
-            lineterm="",
-            n=context_lines,
-        )
+    # Identical content (idempotent edits) needs no splitting or diffing
+    if original == modified:
+        return "No changes detected"
+
+    if _is_large(original) or _is_large(modified):
+        hunk_lines = _git_diff_lines(original, modified, context_lines)
+        if hunk_lines is not None:
+            if not hunk_lines:
+                return "No changes detected"
+            return _format_diff(hunk_lines, file_path, max_lines_per_type, max_line_length)
+
+    # Lines keep their endings so edits that only change line endings, or add or
+    # remove the final newline, still show up; _format_diff strips them
+    diff = unified_diff(
+        original.splitlines(keepends=True),
+        modified.splitlines(keepends=True),
+        fromfile=file_path,
+        tofile=file_path,
+        lineterm="",
+        n=context_lines,
     )
 
-    if not diff:
+    # Skip '---' and '+++' header lines; an empty diff means no changes
+    if next(diff, None) is None:
         return "No changes detected"
+    next(diff, None)
 
-    # Format the diff output
-    filename = os.path.basename(file_path)
-    output_lines = [f"Update({filename})"]
+    return _format_diff(diff, file_path, max_lines_per_type, max_line_length)
 
-    # Count changes
-    additions = sum(1 for line in diff if line.startswith("+") and not line.startswith("+++"))
-    deletions = sum(1 for line in diff if line.startswith("-") and not line.startswith("---"))
 
-    change_summary = []
-    if additions > 0:
-        change_summary.append(f"Added {additions} line{'s' if additions != 1 else ''}")
-    if deletions > 0:
-        change_summary.append(f"Removed {deletions} line{'s' if deletions != 1 else ''}")
+def _is_large(content: str) -> bool:
+    """Check whether content is big enough to diff with git."""
+    return len(content) > LARGE_DIFF_CHARS or content.count("\n") > LARGE_DIFF_LINES
+
 
-    output_lines.append(f"  ⎿  {', '.join(change_summary)}")
+def _git_diff_lines(original: str, modified: str, context_lines: int) -> list[str] | None:
+    """Diff two texts with ``git diff --no-index``.
+
+    Args:
+        original: Original file content
+        modified: Modified file content
+        context_lines: Number of context lines to show around changes
+
+    Returns:
+        Hunk lines after the '---'/'+++' headers (empty if nothing changed),
+        or None if git is unavailable or failed, so the caller falls back to difflib
+    """
+    try:
+        with tempfile.TemporaryDirectory(prefix="capybara-diff-") as tmp_dir:
+            original_path = Path(tmp_dir) / "original"
+            modified_path = Path(tmp_dir) / "modified"
+            original_path.write_text(original, encoding="utf-8")
+            modified_path.write_text(modified, encoding="utf-8")
+
+            result = subprocess.run(
+                [
+                    "git",
+                    "diff",
+                    "--no-index",
+                    "--no-color",
+                    "--no-ext-diff",
+                    "--no-textconv",
+                    f"--unified={context_lines}",
+                    str(original_path),
+                    str(modified_path),
+                ],
+                capture_output=True,
+                timeout=30,
+            )
+    except (OSError, UnicodeError, subprocess.TimeoutExpired):
+        return None
+
+    # Exit code 0 means no differences, 1 means differences, anything else is an error
+    if result.returncode == 0:
+        return []
+    if result.returncode != 1:
+        return None
+
+    lines = result.stdout.decode("utf-8", errors="replace").split("\n")
+    for i, line in enumerate(lines):
+        if line.startswith("+++ "):
+            return lines[i + 1 :]
+
+    # No text hunks (e.g. git treated the files as binary)
+    return None
+
+
+def _format_diff(
+    diff: Iterator[str] | list[str],
+    file_path: str,
+    max_lines_per_type: int,
+    max_line_length: int,
+) -> str:
+    """Format unified diff hunk lines (headers already skipped) for CLI display."""
+    # Format the diff output; the summary line is filled in once counts are known
+    filename = os.path.basename(file_path)
+    output_lines = [f"Update({filename})", ""]
 
-    # Parse and format diff content with truncation
+    # Count and format changes with truncation
     current_line_num = 1
-    shown_additions = 0
-    shown_deletions = 0
-    truncated_additions = 0
-    truncated_deletions = 0
+    additions = 0
+    deletions = 0
 
-    for line in diff[2:]:  # Skip '---' and '+++' header lines
-        if line.startswith("@@"):
+    for line in diff:
+        tag = line[:1]
+        if tag == "+":
+            # Added line
+            additions += 1
+            if additions <= max_lines_per_type:
+                content = _truncate_line(line[1:].rstrip(_LINE_ENDINGS), max_line_length)
+                output_lines.append(f"     {current_line_num:4d} +{content}")
+            current_line_num += 1
+        elif tag == "-":
+            # Deleted line
+            deletions += 1
+            if deletions <= max_lines_per_type:
+                content = _truncate_line(line[1:].rstrip(_LINE_ENDINGS), max_line_length)
+                output_lines.append(f"          -{content}")
+        elif tag == " ":
+            # Context line - skip to save space
+            current_line_num += 1
+        elif tag == "@":
             # Parse line numbers from @@ -old_start,old_count +new_start,new_count @@
             parts = line.split()
             if len(parts) >= 3:
@@ -89,28 +180,18 @@ def generate_diff(
                     current_line_num = int(new_start)
                 except ValueError:
                     current_line_num = 1
-        elif line.startswith("-"):
-            # Deleted line
-            if shown_deletions < max_lines_per_type:
-                content = _truncate_line(line[1:].rstrip("\n"), max_line_length)
-                output_lines.append(f"          -{content}")
-                shown_deletions += 1
-            else:
-                truncated_deletions += 1
-        elif line.startswith("+"):
-            # Added line
-            if shown_additions < max_lines_per_type:
-                content = _truncate_line(line[1:].rstrip("\n"), max_line_length)
-                output_lines.append(f"     {current_line_num:4d} +{content}")
-                shown_additions += 1
-            else:
-                truncated_additions += 1
-            current_line_num += 1
-        elif line.startswith(" "):
-            # Context line - skip to save space
-            current_line_num += 1
+
+    change_summary = []
+    if additions > 0:
+        change_summary.append(f"Added {additions} line{'s' if additions != 1 else ''}")
+    if deletions > 0:
+        change_summary.append(f"Removed {deletions} line{'s' if deletions != 1 else ''}")
+
+    output_lines[1] = f"  ⎿  {', '.join(change_summary)}"
 
     # Add truncation indicators
+    truncated_deletions = deletions - max_lines_per_type
+    truncated_additions = additions - max_lines_per_type
     if truncated_deletions > 0:
         output_lines.append(f"          ... ({truncated_deletions} more deletions)")
     if truncated_additions > 0:
@@ -1,12 +1,16 @@
 """Filesystem tools: read, write, edit."""
 
+import asyncio
+import os
+from itertools import islice
 from pathlib import Path
 
-import aiofiles
-
 from capybara.tools.builtin.diff_formatter import generate_diff
 from capybara.tools.registry import ToolRegistry
 
+# Stripped from lines shown by read_file; other trailing whitespace is kept
+_LINE_ENDINGS = "\r\n"
+
 
 def register_filesystem_tools(registry: ToolRegistry) -> None:
     """Register filesystem tools with the registry."""
@@ -50,18 +54,10 @@ Notes:
     async def read_file(path: str, offset: int = 1, limit: int = 500) -> str:
         """Read file with line numbers."""
         try:
-            async with aiofiles.open(path) as f:
-                lines = await f.readlines()
-
+            # Reading and formatting happen in one worker thread call, so large
+            # windows don't block the event loop
             start = max(0, offset - 1)
-            end = start + limit
-            selected = lines[start:end]
-
-            result = []
-            for i, line in enumerate(selected, start=start + 1):
-                result.append(f"{i:4d}|{line.rstrip()}")
-
-            return "\n".join(result) if result else "(empty file)"
+            return await asyncio.to_thread(_read_numbered, path, start, limit)
         except FileNotFoundError:
             return f"Error: File not found: {path}"
         except Exception as e:
@@ -94,10 +90,7 @@ Notes:
     async def write_file(path: str, content: str) -> str:
         """Write content to file."""
         try:
-            p = Path(path)
-            p.parent.mkdir(parents=True, exist_ok=True)
-            async with aiofiles.open(path, "w") as f:
-                await f.write(content)
+            await asyncio.to_thread(_write_text, path, content)
             return f"Successfully wrote {len(content)} bytes to {path}"
         except Exception as e:
             return f"Error: {e}"
@@ -153,24 +146,38 @@ Notes:
             if old_string == new_string:
                 return "Error: old_string and new_string must be different"
 
-            async with aiofiles.open(path) as f:
-                original_content = await f.read()
-
-            count = original_content.count(old_string)
-            if count == 0:
-                return f"Error: old_string not found in {path}"
-            if count > 1 and not replace_all:
-                return f"Error: old_string found {count} times. Use replace_all=true or make it unique."
-
-            # Perform replacement
-            new_content = original_content.replace(old_string, new_string)
+            original_content = await asyncio.to_thread(_read_text, path)
+
+            # Perform replacement, scanning the file once in the common cases
+            if replace_all:
+                new_content = original_content.replace(old_string, new_string)
+                # old_string != new_string, so equal content means nothing was replaced
+                if new_content == original_content:
+                    return f"Error: old_string not found in {path}"
+                size_delta = len(old_string) - len(new_string)
+                if size_delta:
+                    count = (len(original_content) - len(new_content)) // size_delta
+                else:
+                    count = original_content.count(old_string)
+            else:
+                index = original_content.find(old_string)
+                if index == -1:
+                    return f"Error: old_string not found in {path}"
+                end = index + len(old_string)
+                if original_content.find(old_string, end) != -1:
+                    count = original_content.count(old_string)
+                    return f"Error: old_string found {count} times. Use replace_all=true or make it unique."
+                count = 1
+                new_content = original_content[:index] + new_string + original_content[end:]
 
             # Write back to file
-            async with aiofiles.open(path, "w") as f:
-                await f.write(new_content)
+            await asyncio.to_thread(_write_text, path, new_content)
 
-            # Generate diff output
-            diff_output = generate_diff(original_content, new_content, path)
+            # Generate diff output; large files run git or a long difflib match,
+            # so keep it off the event loop
+            diff_output = await asyncio.to_thread(
+                generate_diff, original_content, new_content, path
+            )
 
             # Generate success message
             if replace_all and count > 1:
@@ -207,14 +214,71 @@ Usage:
             if not p.is_dir():
                 return f"Error: Not a directory: {path}"
 
-            entries = []
-            for item in sorted(p.iterdir()):
-                if item.is_dir():
-                    entries.append(f"[DIR]  {item.name}/")
-                else:
-                    size = item.stat().st_size
-                    entries.append(f"[FILE] {item.name} ({size:,} bytes)")
+            entries = await asyncio.to_thread(_list_entries, p)
 
             return "\n".join(entries) if entries else "(empty directory)"
         except Exception as e:
             return f"Error: {e}"
+
+
+def _read_numbered(path: str, start: int, limit: int) -> str:
+    """Read up to limit lines starting at 0-indexed line start, with line numbers.
+
+    Streams the file and stops after the last requested line, so reading a
+    window of a large file doesn't load all of it.
+    """
+    with open(path) as f:
+        selected = islice(f, start, start + limit)
+        return (
+            "\n".join(
+                f"{i:4d}|{line.rstrip(_LINE_ENDINGS)}"
+                for i, line in enumerate(selected, start=start + 1)
+            )
+            or "(empty file)"
+        )
+
+
+def _read_text(path: str) -> str:
+    """Read a whole text file."""
+    with open(path) as f:
+        return f.read()
+
+
+def _write_text(path: str, content: str) -> None:
+    """Write a text file in place, creating parent directories.
+
+    A file that already has this content is left alone.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+
+    # Skip rewriting unchanged content (and waking file watchers). Encoded size
+    # is between 1 and 4 bytes per character, so only plausible sizes are read.
+    try:
+        size = target.stat().st_size
+    except FileNotFoundError:
+        size = None
+    if size is not None and len(content) <= size <= 4 * len(content):
+        try:
+            with open(target) as f:
+                if f.read() == content:
+                    return
+        except UnicodeDecodeError:
+            pass
+
+    with open(target, "w") as f:
+        f.write(content)
+
+
+def _list_entries(path: Path) -> list[str]:
+    """Format directory entries sorted by name."""
+    # scandir answers is_dir() from the directory listing and caches stat()
+    with os.scandir(path) as it:
+        items = sorted(it, key=lambda e: e.name)
+
+    return [
+        f"[DIR]  {item.name}/"
+        if item.is_dir()
+        else f"[FILE] {item.name} ({item.stat().st_size:,} bytes)"
+        for item in items
+    ]
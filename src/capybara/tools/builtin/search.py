@@ -1,10 +1,20 @@
 """Search tools: glob patterns and grep."""
 
 import asyncio
+import fnmatch
+import functools
+import os
+import re
+import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from capybara.tools.registry import ToolRegistry
 
+# Glob results with more matches than this are stat-ed in parallel
+_PARALLEL_STAT_MIN = 1000
+_stat_pool: ThreadPoolExecutor | None = None
+
 
 def register_search_tools(registry: ToolRegistry) -> None:
     """Register search tools with the registry."""
@@ -42,11 +52,8 @@ Usage:
             if not base.exists():
                 return f"Error: Path does not exist: {path}"
 
-            matches = list(base.glob(pattern))
-
-            # Sort by modification time (newest first)
-            matches.sort(key=lambda p: p.stat().st_mtime, reverse=True)
-            matches = matches[:limit]
+            # Walking and stat-ing a large tree blocks, so keep it off the event loop
+            matches = await asyncio.to_thread(_glob_newest, base, pattern, limit)
 
             if not matches:
                 return f"No files matching '{pattern}' in {path}"
@@ -94,17 +101,26 @@ Usage:
         """Search for pattern in files using ripgrep or grep."""
         try:
             # Try ripgrep first, fall back to grep
-            rg_available = await _check_command("rg")
+            rg_path = _which("rg")
+            # grep only matches --include/--exclude against base names, so globs
+            # with a "/" are applied to its output paths instead
+            path_glob: tuple[re.Pattern[str], bool] | None = None
 
-            if rg_available:
-                cmd = ["rg", "-n", "--no-heading", "-m", str(limit)]
+            if rg_path:
+                cmd = [rg_path, "-n", "--no-heading", "-m", str(limit)]
                 if file_pattern:
                     cmd.extend(["-g", file_pattern])
                 cmd.extend([pattern, path])
             else:
-                cmd = ["grep", "-rn", "-m", str(limit)]
+                cmd = [_which("grep") or "grep", "-rn", "-m", str(limit)]
                 if file_pattern:
-                    cmd.extend(["--include", file_pattern])
+                    negate = file_pattern.startswith("!")
+                    glob = file_pattern[1:] if negate else file_pattern
+                    if "/" in glob:
+                        path_glob = (_compile_file_pattern(glob), negate)
+                    else:
+                        # rg's "!glob" negation is grep's --exclude
+                        cmd.extend(["--exclude" if negate else "--include", glob])
                 cmd.extend([pattern, path])
 
             process = await asyncio.create_subprocess_exec(
@@ -117,10 +133,9 @@ Usage:
             if process.returncode == 0:
                 output = stdout.decode("utf-8", errors="replace")
                 lines = output.strip().split("\n")
-                if len(lines) > limit:
-                    lines = lines[:limit]
-                    lines.append(f"... (truncated to {limit} matches)")
-                return "\n".join(lines) if lines[0] else "No matches found"
+                if path_glob:
+                    lines = _filter_by_path(lines, path, *path_glob)
+                return _format_matches(lines, limit)
             elif process.returncode == 1:
                 return "No matches found"
             else:
@@ -132,16 +147,70 @@ Usage:
             return f"Error: {e}"
 
 
-async def _check_command(cmd: str) -> bool:
-    """Check if a command is available."""
-    try:
-        process = await asyncio.create_subprocess_exec(
-            "which",
-            cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-        )
-        await process.communicate()
-        return process.returncode == 0
-    except Exception:
-        return False
+def _glob_newest(base: Path, pattern: str, limit: int) -> list[Path]:
+    """Glob under base and return up to limit matches, newest first."""
+    if "/" not in pattern and "**" not in pattern:
+        # Single directory: match names from one scandir and reuse its cached stat.
+        # normcase keeps fnmatch's case handling (case-insensitive on Windows).
+        match = _compile_file_pattern(os.path.normcase(pattern)).match
+        with os.scandir(base) as it:
+            pairs = [
+                (entry.stat().st_mtime, base / entry.name)
+                for entry in it
+                if match(os.path.normcase(entry.name))
+            ]
+    else:
+        # Stat each match once up front, then sort the (mtime, path) pairs
+        matches = list(base.glob(pattern))
+        if len(matches) > _PARALLEL_STAT_MIN:
+            # Cold caches make each stat a disk round trip; overlap them
+            mtimes = list(_get_stat_pool().map(_mtime, matches))
+        else:
+            mtimes = [_mtime(p) for p in matches]
+        pairs = list(zip(mtimes, matches, strict=True))
+
+    # Sort by modification time (newest first)
+    pairs.sort(key=lambda pair: pair[0], reverse=True)
+    return [p for _, p in pairs[:limit]]
+
+
+def _mtime(path: Path) -> float:
+    return path.stat().st_mtime
+
+
+def _get_stat_pool() -> ThreadPoolExecutor:
+    """Get or create the thread pool for parallel glob stats."""
+    global _stat_pool
+    if _stat_pool is None:
+        _stat_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="glob-stat")
+    return _stat_pool
+
+
+@functools.cache
+def _which(cmd: str) -> str | None:
+    """Locate a command on PATH once per process."""
+    return shutil.which(cmd)
+
+
+def _format_matches(lines: list[str], limit: int) -> str:
+    """Join match lines, truncating to limit."""
+    if len(lines) > limit:
+        lines = lines[:limit]
+        lines.append(f"... (truncated to {limit} matches)")
+    return "\n".join(lines) if lines and lines[0] else "No matches found"
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_file_pattern(file_pattern: str) -> re.Pattern[str]:
+    """Compile a file name or relative path glob."""
+    return re.compile(fnmatch.translate(file_pattern))
+
+
+def _filter_by_path(lines: list[str], root: str, glob: re.Pattern[str], negate: bool) -> list[str]:
+    """Keep grep output lines whose path relative to root matches glob (or not, if negate)."""
+    kept = []
+    for line in lines:
+        rel = os.path.relpath(line.split(":", 1)[0], root).replace(os.sep, "/")
+        if bool(glob.match(rel)) != negate:
+            kept.append(line)
+    return kept
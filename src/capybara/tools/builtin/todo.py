@@ -1,19 +1,27 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Sequence
 from enum import Enum
+from typing import TYPE_CHECKING, Any, Literal
 
-# Import state manager for UI integration
-# Circular import is safe because todo_state.py only imports TodoItem
-from typing import TYPE_CHECKING, Any
-
-from pydantic import BaseModel
+import orjson
+from pydantic import BaseModel, PrivateAttr, TypeAdapter
 
 from capybara.tools.base import AgentMode
 from capybara.tools.registry import ToolRegistry
 
 if TYPE_CHECKING:
-    pass
+    from capybara.tools.builtin.todo_state import TodoStateManager
+
+
+def _dump(obj: Any) -> str:
+    """Serialize a tool response as compact JSON.
+
+    Responses are read by the model, not people, so indentation would only
+    add tokens.
+    """
+    return orjson.dumps(obj).decode()
+
 
 # --- Data Models ---
 
@@ -30,16 +38,58 @@ class TodoItem(BaseModel):
     content: str
     status: TodoStatus = TodoStatus.PENDING
 
+    _dump_cache: dict[str, Any] | None = PrivateAttr(default=None)
+
+    def dump(self) -> dict[str, Any]:
+        """model_dump() computed once per item.
+
+        Items are replaced rather than mutated, so the cached dict stays valid.
+        Callers must not modify it.
+        """
+        if self._dump_cache is None:
+            self._dump_cache = self.model_dump()
+        return self._dump_cache
+
+
+# Validates a whole write_todo payload in one call
+_TODO_LIST_ADAPTER = TypeAdapter(list[TodoItem])
+
 
 # --- State ---
 
 # In-memory storage for the session
 _TODOS: list[TodoItem] = []
 
+# Position of each todo in _TODOS, the id of the in_progress todo and the
+# number of completed todos, kept in sync on every mutation so tools don't
+# scan the list
+_INDEX: dict[str, int] = {}
+_IN_PROGRESS: str | None = None
+_COMPLETED_COUNT = 0
+
+# read_todo response and get_todos snapshot for the current list; cleared on
+# every mutation
+_READ_CACHE: str | None = None
+_SNAPSHOT: tuple[TodoItem, ...] | None = None
 
-def get_todos() -> list[TodoItem]:
-    """Get current list of todos (read-only copy)."""
-    return list(_TODOS)
+
+def _set_todos(todos: list[TodoItem]) -> None:
+    """Replace the todo list and rebuild the lookup state."""
+    global _TODOS, _INDEX, _IN_PROGRESS, _COMPLETED_COUNT, _READ_CACHE, _SNAPSHOT
+    _TODOS = todos
+    _READ_CACHE = None
+    _SNAPSHOT = None
+    _COMPLETED_COUNT = sum(1 for t in todos if t.status is TodoStatus.COMPLETED)
+    _INDEX = {t.id: i for i, t in enumerate(todos)}
+    _IN_PROGRESS = next((t.id for t in todos if t.status is TodoStatus.IN_PROGRESS), None)
+
+
+def get_todos() -> Sequence[TodoItem]:
+    """Get current list of todos (read-only snapshot)."""
+    global _SNAPSHOT
+    if _SNAPSHOT is None:
+        _SNAPSHOT = tuple(_TODOS)
+    return _SNAPSHOT
 
 
 # --- Tool Implementation ---
@@ -82,24 +132,20 @@ def register_todo_tool(registry: ToolRegistry) -> None:
     )
     async def write_todo(todos: list[dict[str, Any]]) -> str:
         """Create a new todo list."""
-        global _TODOS
-
         # VALIDATION: Can only write when list is empty or all completed
-        if _TODOS:
-            all_completed = all(t.status == TodoStatus.COMPLETED for t in _TODOS)
-            if not all_completed:
-                pending_count = sum(1 for t in _TODOS if t.status != TodoStatus.COMPLETED)
-                return (
-                    f"Error: Cannot create new todo list while {pending_count} tasks are still pending. "
-                    f"You must either:\n"
-                    f"  1. Complete all current tasks, OR\n"
-                    f"  2. Call delete_todo() to clear the current list first.\n"
-                    f"Use update_todo_status(id='...', status='...') to modify existing todos."
-                )
+        pending_count = len(_TODOS) - _COMPLETED_COUNT
+        if pending_count:
+            return (
+                f"Error: Cannot create new todo list while {pending_count} tasks are still pending. "
+                f"You must either:\n"
+                f"  1. Complete all current tasks, OR\n"
+                f"  2. Call delete_todo() to clear the current list first.\n"
+                f"Use update_todo_status(id='...', status='...') to modify existing todos."
+            )
 
         try:
             # Validate and parse
-            new_list = [TodoItem(**item) for item in todos]
+            new_list = _TODO_LIST_ADAPTER.validate_python(todos)
 
             # Check uniqueness of IDs
             ids = [t.id for t in new_list]
@@ -107,27 +153,27 @@ def register_todo_tool(registry: ToolRegistry) -> None:
                 return "Error: Todo IDs must be unique."
 
             # CRITICAL: Enforce sequential execution - only 1 task can be in_progress
-            in_progress_tasks = [t for t in new_list if t.status == TodoStatus.IN_PROGRESS]
-            if len(in_progress_tasks) > 1:
-                in_progress_ids = [t.id for t in in_progress_tasks]
+            # (enum members are singletons, so identity checks suffice)
+            in_progress_count = sum(1 for t in new_list if t.status is TodoStatus.IN_PROGRESS)
+            if in_progress_count > 1:
+                in_progress_ids = [t.id for t in new_list if t.status is TodoStatus.IN_PROGRESS]
                 return (
                     f"Error: Only 1 task can be 'in_progress' at a time. "
-                    f"Found {len(in_progress_tasks)} tasks in_progress: {in_progress_ids}. "
+                    f"Found {in_progress_count} tasks in_progress: {in_progress_ids}. "
                     f"Complete the current task before starting another."
                 )
 
             # Update state
-            _TODOS = new_list
+            _set_todos(new_list)
 
             # Notify state manager for UI updates
             _notify_state_change(new_list)
 
-            return json.dumps(
+            return _dump(
                 {
                     "message": f"Created {len(_TODOS)} todos",
-                    "todos": [t.model_dump() for t in _TODOS],
-                },
-                indent=2,
+                    "todos": [t.dump() for t in _TODOS],
+                }
             )
 
         except Exception as e:
@@ -141,13 +187,15 @@ def register_todo_tool(registry: ToolRegistry) -> None:
     )
     async def read_todo() -> str:
         """Read the current todo list."""
-        return json.dumps(
-            {
-                "message": f"Retrieved {len(_TODOS)} todos",
-                "todos": [t.model_dump() for t in _TODOS],
-            },
-            indent=2,
-        )
+        global _READ_CACHE
+        if _READ_CACHE is None:
+            _READ_CACHE = _dump(
+                {
+                    "message": f"Retrieved {len(_TODOS)} todos",
+                    "todos": [t.dump() for t in _TODOS],
+                }
+            )
+        return _READ_CACHE
 
     @registry.tool(
         name="update_todo_status",
@@ -168,60 +216,63 @@ def register_todo_tool(registry: ToolRegistry) -> None:
     )
     async def update_todo_status(id: str, status: str) -> str:
         """Update a todo's status."""
-        global _TODOS
+        global _IN_PROGRESS, _COMPLETED_COUNT, _READ_CACHE, _SNAPSHOT
 
         if not _TODOS:
             return "Error: No todos exist. Use write_todo(...) to create a list first."
 
         # Find todo by ID
-        todo_index = -1
-        todo_to_update = None
-        for i, t in enumerate(_TODOS):
-            if t.id == id:
-                todo_to_update = t
-                todo_index = i
-                break
-
-        if todo_to_update is None:
-            available_ids = [t.id for t in _TODOS]
+        todo_index = _INDEX.get(id)
+        if todo_index is None:
+            available_ids = list(_INDEX)
             return f"Error: Todo with id='{id}' not found. Available IDs: {available_ids}"
+        todo_to_update = _TODOS[todo_index]
 
         # Prevent updating already completed tasks (unless moving FROM completed, but usually not intended)
         # User constraint: "don't update for processed task (old task)"
         # But maybe they want to reopen? Assuming strict "don't update processed" means if it's completed, don't touch.
         # However, the user might want to correct a mistake. Let's strictly follow "don't update for processed task"
         if (
-            todo_to_update.status == TodoStatus.COMPLETED
-            or todo_to_update.status == TodoStatus.CANCELLED
+            todo_to_update.status is TodoStatus.COMPLETED
+            or todo_to_update.status is TodoStatus.CANCELLED
         ):
             return f"Error: Cannot update todo '{id}' because it is already {todo_to_update.status.value}. Use write_todo to start new tasks if needed."
 
         try:
             # Validate in_progress constraint if we are setting to in_progress
-            if status == TodoStatus.IN_PROGRESS and todo_to_update.status != TodoStatus.IN_PROGRESS:
-                current_in_progress = [t for t in _TODOS if t.status == TodoStatus.IN_PROGRESS]
-                if current_in_progress:
-                    return (
-                        f"Error: Only 1 task can be 'in_progress' at a time. "
-                        f"Task '{current_in_progress[0].id}' is currently in_progress. "
-                        f"Complete or cancel it before starting '{id}'."
-                    )
+            if status == TodoStatus.IN_PROGRESS and _IN_PROGRESS and _IN_PROGRESS != id:
+                return (
+                    f"Error: Only 1 task can be 'in_progress' at a time. "
+                    f"Task '{_IN_PROGRESS}' is currently in_progress. "
+                    f"Complete or cancel it before starting '{id}'."
+                )
 
             # Update the status
             new_status = TodoStatus(status)
-            updated_todo = todo_to_update.model_copy(update={"status": new_status})
+            # model_construct (not model_copy) so the copy doesn't inherit the old dump cache
+            updated_todo = TodoItem.model_construct(
+                id=todo_to_update.id, content=todo_to_update.content, status=new_status
+            )
 
             _TODOS[todo_index] = updated_todo
+            _READ_CACHE = None
+            _SNAPSHOT = None
+            if new_status is TodoStatus.IN_PROGRESS:
+                _IN_PROGRESS = id
+            elif _IN_PROGRESS == id:
+                _IN_PROGRESS = None
+            # Completed todos can't be updated, so the count only grows here
+            if new_status is TodoStatus.COMPLETED:
+                _COMPLETED_COUNT += 1
 
             # Notify state manager
             _notify_state_change(_TODOS)
 
-            return json.dumps(
+            return _dump(
                 {
                     "message": f"Updated todo '{id}' status to '{status}'",
-                    "todo": updated_todo.model_dump(),
-                },
-                indent=2,
+                    "todo": updated_todo.dump(),
+                }
             )
 
         except ValueError:
@@ -237,28 +288,33 @@ def register_todo_tool(registry: ToolRegistry) -> None:
     )
     async def delete_todo() -> str:
         """Delete all todos."""
-        global _TODOS
         count = len(_TODOS)
-        _TODOS = []
+        _set_todos([])
 
         # Notify state manager
         _notify_state_change([])
 
-        return json.dumps(
-            {"message": f"Deleted {count} todos. Todo list cleared."},
-            indent=2,
-        )
+        return _dump({"message": f"Deleted {count} todos. Todo list cleared."})
+
+
+# State manager, imported on first notification; False if it isn't available
+_todo_state_ref: TodoStateManager | Literal[False] | None = None
 
 
 def _notify_state_change(todos: list[TodoItem]) -> None:
     """Notify state manager of todo changes for UI updates.
 
-    Lazy import to avoid circular dependency issues.
+    Lazy import to avoid circular dependency issues; the module reference is
+    cached after the first notification.
     """
-    try:
-        from capybara.tools.builtin.todo_state import todo_state
-
-        todo_state.update_todos(todos)
-    except ImportError:
-        # State manager not available, skip notification
-        pass
+    global _todo_state_ref
+    if _todo_state_ref is None:
+        try:
+            from capybara.tools.builtin.todo_state import todo_state
+
+            _todo_state_ref = todo_state
+        except ImportError:
+            # State manager not available, skip notifications from now on
+            _todo_state_ref = False
+    if _todo_state_ref:
+        _todo_state_ref.update_todos(todos)
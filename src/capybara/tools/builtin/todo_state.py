@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 from capybara.tools.builtin.todo import TodoItem
 
@@ -15,47 +15,56 @@ class TodoStateManager:
     """
 
     def __init__(self) -> None:
-        self._todos: list[TodoItem] = []
-        self._observers: list[Callable[[list[TodoItem]], None]] = []
-
-    def get_todos(self) -> list[TodoItem]:
-        """Get current todo list (read-only copy)."""
-        return list(self._todos)
-
-    def update_todos(self, new_todos: list[TodoItem]) -> None:
+        # Immutable snapshot, handed out as-is instead of copied on every read
+        self._todos: tuple[TodoItem, ...] = ()
+        # Insertion-ordered set of callbacks (dict keys), for O(1) subscribe/unsubscribe.
+        # Keyed by the callback itself, not id(): bound methods are new objects on
+        # every attribute access but compare equal.
+        self._observers: dict[Callable[[Sequence[TodoItem]], None], None] = {}
+        # Tuple of the observers, rebuilt only when subscriptions change so
+        # notifying (far more frequent) doesn't copy them, and callbacks may
+        # unsubscribe while being notified
+        self._observers_snapshot: tuple[Callable[[Sequence[TodoItem]], None], ...] = ()
+
+    def get_todos(self) -> Sequence[TodoItem]:
+        """Get current todo list (read-only snapshot)."""
+        return self._todos
+
+    def update_todos(self, new_todos: Sequence[TodoItem]) -> None:
         """Update state and notify all observers.
 
         Args:
             new_todos: New todo list to replace current state
         """
-        self._todos = list(new_todos)
+        self._todos = tuple(new_todos)
         self._notify()
 
-    def subscribe(self, callback: Callable[[list[TodoItem]], None]) -> None:
+    def subscribe(self, callback: Callable[[Sequence[TodoItem]], None]) -> None:
         """Subscribe to state changes.
 
         Args:
-            callback: Function to call when todos change. Receives List[TodoItem].
+            callback: Function to call when todos change. Receives Sequence[TodoItem].
         """
-        if callback not in self._observers:
-            self._observers.append(callback)
+        self._observers.setdefault(callback, None)
+        self._observers_snapshot = tuple(self._observers)
 
-    def unsubscribe(self, callback: Callable[[list[TodoItem]], None]) -> None:
+    def unsubscribe(self, callback: Callable[[Sequence[TodoItem]], None]) -> None:
         """Unsubscribe from state changes.
 
         Args:
             callback: Previously subscribed callback to remove
         """
-        if callback in self._observers:
-            self._observers.remove(callback)
+        self._observers.pop(callback, None)
+        self._observers_snapshot = tuple(self._observers)
 
     def clear_observers(self) -> None:
         """Remove all observers (cleanup on exit)."""
         self._observers.clear()
+        self._observers_snapshot = ()
 
     def _notify(self) -> None:
         """Notify all observers of state change."""
-        for callback in self._observers:
+        for callback in self._observers_snapshot:
             try:
                 callback(self._todos)
             except Exception as e:
@@ -1,5 +1,6 @@
 """MCP bridge for integrating MCP tools into the tool registry."""
 
+import asyncio
 from typing import Any
 
 from capybara.core.config import MCPConfig
@@ -13,6 +14,8 @@ class MCPBridge:
     def __init__(self, config: MCPConfig) -> None:
         self.config = config
         self._clients: dict[str, MCPClient] = {}
+        # Prefixed tool name -> owning client, filled in register_with_registry
+        self._tool_to_client: dict[str, MCPClient] = {}
 
     async def connect_all(self) -> int:
         """Connect to all configured MCP servers.
@@ -23,11 +26,16 @@ class MCPBridge:
         if not self.config.enabled:
             return 0
 
+        # Handshakes run concurrently, so startup waits for the slowest server
+        # rather than the sum of all of them
+        clients = [MCPClient(name, cfg) for name, cfg in self.config.servers.items()]
+        results = await asyncio.gather(*(c.connect() for c in clients), return_exceptions=True)
+
         connected = 0
-        for name, server_config in self.config.servers.items():
-            client = MCPClient(name, server_config)
-            if await client.connect():
-                self._clients[name] = client
+        for client, ok in zip(clients, results, strict=True):
+            # Failed connects (False or an exception) are skipped
+            if ok is True:
+                self._clients[client.name] = client
                 connected += 1
 
         return connected
@@ -37,6 +45,7 @@ class MCPBridge:
         for client in self._clients.values():
             await client.disconnect()
         self._clients.clear()
+        self._tool_to_client.clear()
 
     def get_all_tools(self) -> list[dict[str, Any]]:
         """Get all tools from connected MCP servers."""
@@ -56,11 +65,10 @@ class MCPBridge:
             Tool result as string
         """
         # Find which server owns this tool
-        for name, client in self._clients.items():
-            if tool_name.startswith(f"{name}__"):
-                return await client.call_tool(tool_name, arguments)
-
-        return f"Error: No MCP server found for tool '{tool_name}'"
+        client = self._tool_to_client.get(tool_name)
+        if client is None:
+            return f"Error: No MCP server found for tool '{tool_name}'"
+        return await client.call_tool(tool_name, arguments)
 
     def register_with_registry(self, registry: ToolRegistry) -> int:
         """Register all MCP tools with a tool registry.
@@ -75,6 +83,7 @@ class MCPBridge:
         for _, client in self._clients.items():
             for tool_schema in client.tools:
                 tool_name = tool_schema["function"]["name"]
+                self._tool_to_client[tool_name] = client
 
                 # Create wrapper function for this tool with proper closure
                 def make_wrapper(captured_name: str):
@@ -7,12 +7,18 @@ from capybara.core.config import MCPServerConfig
 
 
 class MCPClient:
-    """Client for connecting to MCP servers via stdio."""
+    """Client for connecting to MCP servers via stdio.
+
+    The server process and its session stay open from connect() until
+    disconnect(), so tool calls are a single RPC on the existing session.
+    """
 
     def __init__(self, name: str, config: MCPServerConfig) -> None:
         self.name = name
         self.config = config
-        self._process: asyncio.subprocess.Process | None = None
+        self._session: Any = None
+        self._runner: asyncio.Task[None] | None = None
+        self._closing: asyncio.Event | None = None
         self._tools: list[dict[str, Any]] = []
         self._connected = False
 
@@ -21,8 +27,7 @@ class MCPClient:
         try:
             # Import MCP only when needed (optional dependency)
             try:
-                from mcp import ClientSession, StdioServerParameters
-                from mcp.client.stdio import stdio_client
+                from mcp import StdioServerParameters
             except ImportError:
                 return False
 
@@ -32,7 +37,26 @@ class MCPClient:
                 env=self.config.env if self.config.env else None,
             )
 
-            # Create and connect client
+            # The stdio transport's context managers must be entered and exited
+            # in the same task, so a runner task owns the session for its lifetime
+            ready: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+            self._closing = asyncio.Event()
+            self._runner = asyncio.create_task(
+                self._run_session(server_params, ready, self._closing)
+            )
+            return await ready
+        except Exception as e:
+            print(f"Failed to connect to MCP server {self.name}: {e}")
+            return False
+
+    async def _run_session(
+        self, server_params: Any, ready: asyncio.Future[bool], closing: asyncio.Event
+    ) -> None:
+        """Open the session, report readiness, and hold it until disconnect()."""
+        from mcp import ClientSession
+        from mcp.client.stdio import stdio_client
+
+        try:
             async with stdio_client(server_params) as (read, write):
                 async with ClientSession(read, write) as session:
                     # Initialize connection
@@ -41,12 +65,21 @@ class MCPClient:
                     # List available tools
                     tools_response = await session.list_tools()
                     self._tools = [self._convert_tool_schema(tool) for tool in tools_response.tools]
+                    self._session = session
                     self._connected = True
+                    ready.set_result(True)
 
-            return True
+                    await closing.wait()
         except Exception as e:
-            print(f"Failed to connect to MCP server {self.name}: {e}")
-            return False
+            if ready.done():
+                print(f"MCP server {self.name} disconnected: {e}")
+            else:
+                print(f"Failed to connect to MCP server {self.name}: {e}")
+        finally:
+            self._session = None
+            self._connected = False
+            if not ready.done():
+                ready.set_result(False)
 
     def _convert_tool_schema(self, mcp_tool: Any) -> dict[str, Any]:
         """Convert MCP tool schema to OpenAI format."""
@@ -72,32 +105,25 @@ class MCPClient:
     async def call_tool(self, tool_name: str, arguments: dict[str, Any]) -> str:
         """Call a tool on the MCP server."""
         try:
-            from mcp import ClientSession, StdioServerParameters
-            from mcp.client.stdio import stdio_client
+            session = self._session
+            if session is None:
+                return f"Error calling MCP tool: not connected to MCP server {self.name}"
 
             # Strip server prefix from tool name
             if tool_name.startswith(f"{self.name}__"):
                 tool_name = tool_name[len(self.name) + 2 :]
 
-            server_params = StdioServerParameters(
-                command=self.config.command,
-                args=self.config.args,
-                env=self.config.env if self.config.env else None,
-            )
-
-            async with stdio_client(server_params) as (read, write):
-                async with ClientSession(read, write) as session:
-                    await session.initialize()
-                    result = await session.call_tool(tool_name, arguments)
-                    return str(result.content) if result.content else ""
+            result = await session.call_tool(tool_name, arguments)
+            return str(result.content) if result.content else ""
 
         except Exception as e:
             return f"Error calling MCP tool: {e}"
 
     async def disconnect(self) -> None:
         """Disconnect from the MCP server."""
-        if self._process:
-            self._process.terminate()
-            await self._process.wait()
-            self._process = None
+        if self._runner:
+            if self._closing:
+                self._closing.set()
+            await self._runner
+            self._runner = None
         self._connected = False
@@ -1,7 +1,6 @@
 """Tool registry for async tools with OpenAI schema format."""
 
 import asyncio
-import functools
 import json
 from collections.abc import Callable
 from typing import Any
@@ -10,18 +9,28 @@ from capybara.tools.base import AgentMode, ToolRestriction
 
 
 class ToolRegistry:
-    """Registry for async tools with OpenAI schema format."""
+    """Registry for sync and async tools with OpenAI schema format."""
 
     def __init__(self) -> None:
-        self._tools: dict[str, Callable[..., Any]] = {}
+        # Tool function and whether it is a coroutine function, so sync tools
+        # are called directly instead of through an async wrapper
+        self._tools: dict[str, tuple[Callable[..., Any], bool]] = {}
         self._schemas: list[dict[str, Any]] = []
+        # Same schemas keyed by tool name, for lookups without scanning _schemas
+        self._schema_by_name: dict[str, dict[str, Any]] = {}
         self._restrictions: dict[str, ToolRestriction] = {}
+        # to_json() output; cleared whenever _schemas changes
+        self._json_cache: str | None = None
 
     def unregister(self, name: str) -> None:
         """Unregister a tool by name."""
         if name in self._tools:
             del self._tools[name]
-            self._schemas = [s for s in self._schemas if s["function"]["name"] != name]
+            schema = self._schema_by_name.pop(name, None)
+            if schema is not None:
+                self._schemas.remove(schema)
+            self._restrictions.pop(name, None)
+            self._json_cache = None
 
     def tool(
         self,
@@ -29,52 +38,52 @@ class ToolRegistry:
         description: str,
         parameters: dict[str, Any],
         allowed_modes: list[AgentMode] | None = None,
+        overwrite: bool = False,
     ) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
-        """Decorator to register async tools.
+        """Decorator to register sync or async tools.
 
         Args:
             name: Tool name (used in function calling)
             description: Tool description for the LLM
             parameters: JSON Schema for tool parameters
             allowed_modes: Optional list of agent modes allowed to use this tool
+            overwrite: Replace an existing tool with the same name instead of raising
 
         Returns:
             Decorator function
+
+        Raises:
+            ValueError: If a tool with this name is already registered and
+                overwrite is False
         """
+        if name in self._tools:
+            if not overwrite:
+                raise ValueError(f"Tool '{name}' is already registered")
+            self.unregister(name)
 
         def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
-            # Ensure async
-            if not asyncio.iscoroutinefunction(func):
-
-                @functools.wraps(func)
-                async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
-                    return func(*args, **kwargs)
-
-                target_func: Callable[..., Any] = async_wrapper
-            else:
-                target_func = func
-
-            self._tools[name] = target_func
-            self._schemas.append(
-                {
-                    "type": "function",
-                    "function": {
-                        "name": name,
-                        "description": description,
-                        "parameters": {
-                            "$schema": "http://json-schema.org/draft-07/schema#",
-                            "additionalProperties": False,
-                            **parameters,
-                        },
+            self._tools[name] = (func, asyncio.iscoroutinefunction(func))
+            schema = {
+                "type": "function",
+                "function": {
+                    "name": name,
+                    "description": description,
+                    "parameters": {
+                        "$schema": "http://json-schema.org/draft-07/schema#",
+                        "additionalProperties": False,
+                        **parameters,
                     },
-                }
-            )
+                },
+            }
+            self._schemas.append(schema)
+            self._schema_by_name[name] = schema
+            self._json_cache = None
 
             # Store restrictions
             if allowed_modes:
                 self._restrictions[name] = ToolRestriction(allowed_modes=allowed_modes)
 
-            return target_func
+            return func
 
         return decorator
 
@@ -84,6 +93,7 @@ class ToolRegistry:
         func: Callable[..., Any],
         description: str,
         parameters: dict[str, Any],
+        overwrite: bool = False,
     ) -> None:
         """Register a tool programmatically (non-decorator API).
 
@@ -92,9 +102,10 @@ class ToolRegistry:
             func: Tool function (sync or async)
             description: Tool description
             parameters: JSON Schema for parameters
+            overwrite: Replace an existing tool with the same name instead of raising
         """
         # Use decorator internally
-        self.tool(name, description, parameters)(func)
+        self.tool(name, description, parameters, overwrite=overwrite)(func)
 
     async def execute(self, name: str, arguments: dict[str, Any]) -> str:
         """Execute a tool and return result as string.
@@ -106,17 +117,20 @@ class ToolRegistry:
         Returns:
             Tool result as string
         """
-        if name not in self._tools:
+        entry = self._tools.get(name)
+        if entry is None:
             return f"Error: Unknown tool '{name}'"
+        func, is_async = entry
         try:
-            result = await self._tools[name](**arguments)
+            result = await func(**arguments) if is_async else func(**arguments)
             return str(result) if not isinstance(result, str) else result
         except Exception as e:
             return f"Error: {type(e).__name__}: {e}"
 
     def get_tool(self, name: str) -> Callable[..., Any] | None:
         """Get a tool function by name."""
-        return self._tools.get(name)
+        entry = self._tools.get(name)
+        return entry[0] if entry else None
 
     def list_tools(self) -> list[str]:
         """List all registered tool names."""
@@ -127,31 +141,46 @@ class ToolRegistry:
         """Get OpenAI-format tool schemas."""
         return self._schemas
 
+    def clone(self) -> "ToolRegistry":
+        """Create a shallow copy sharing the (immutable) tool functions and schemas."""
+        copy = ToolRegistry()
+        copy._tools = dict(self._tools)
+        copy._schemas = list(self._schemas)
+        copy._schema_by_name = dict(self._schema_by_name)
+        copy._restrictions = dict(self._restrictions)
+        copy._json_cache = self._json_cache
+        return copy
+
     def merge(self, other: "ToolRegistry") -> None:
         """Merge another registry into this one."""
-        for name, func in other._tools.items():
+        for name, entry in other._tools.items():
             if name not in self._tools:
-                self._tools[name] = func
-        for schema in other._schemas:
-            if schema not in self._schemas:
+                self._tools[name] = entry
+        for name, schema in other._schema_by_name.items():
+            if name not in self._schema_by_name:
                 self._schemas.append(schema)
+                self._schema_by_name[name] = schema
+                self._json_cache = None
 
     def to_json(self) -> str:
         """Export schemas as JSON."""
-        return json.dumps(self._schemas, indent=2)
+        if self._json_cache is None:
+            self._json_cache = json.dumps(self._schemas, indent=2)
+        return self._json_cache
 
     def filter_by_mode(self, mode: AgentMode) -> "ToolRegistry":
         """Create filtered registry for specific agent mode."""
         filtered = ToolRegistry()
 
-        for name, func in self._tools.items():
+        for name, entry in self._tools.items():
             restriction = self._restrictions.get(name)
 
             # If no restriction or mode allowed, include tool
             if not restriction or mode in restriction.allowed_modes:
-                schema = next(s for s in self._schemas if s["function"]["name"] == name)
-                filtered._tools[name] = func
+                schema = self._schema_by_name[name]
+                filtered._tools[name] = entry
                 filtered._schemas.append(schema)
+                filtered._schema_by_name[name] = schema
                 if restriction:
                     filtered._restrictions[name] = restriction
 
@@ -3,6 +3,18 @@
 from rich.console import Console
 from rich.text import Text
 
+# Header line: Update(filename)
+_HEADER_PREFIX = "Update("
+
+_DIGITS = "0123456789"
+
+# Style by first non-space character; anything else (truncation notes) is dim
+_STYLE_BY_PREFIX = {
+    "⎿": "yellow",
+    "+": "green",
+    "-": "red",
+}
+
 
 def render_diff(diff_output: str, file_path: str, console: Console) -> None:
     """
@@ -29,35 +41,23 @@ def render_diff(diff_output: str, file_path: str, console: Console) -> None:
         >>> render_diff(diff_output, "/path/to/test.txt", console)
         # Displays simple colored diff lines without box
     """
+    lines = []
     for line in diff_output.split("\n"):
+        stripped = line.lstrip()
         # Skip empty lines
-        if not line.strip():
+        if not stripped:
             continue
 
-        # Header: Update(filename)
-        if line.startswith("Update("):
-            console.print(Text(line, style="bold"))
-
-        # Summary: ⎿ Added X, Removed Y
-        elif "⎿" in line:
-            console.print(Text(line, style="yellow"))
-
-        # Added line: contains + after line number
-        elif "+" in line and not line.startswith("Update("):
-            stripped = line.lstrip()
-            if stripped and (stripped[0].isdigit() or stripped.startswith("+")):
-                console.print(Text(line, style="green"))
-            else:
-                console.print(Text(line, style="dim"))
-
-        # Deleted line: contains - after line number
-        elif "-" in line:
-            stripped = line.lstrip()
-            if stripped.startswith("-"):
-                console.print(Text(line, style="red"))
-            else:
-                console.print(Text(line, style="dim"))
-
-        # Context line or line number
+        # Classify by the first non-space character, looking past the line
+        # number on numbered lines ("  12 +added", "  12  context")
+        if line.startswith(_HEADER_PREFIX):
+            style = "bold"
         else:
-            console.print(Text(line, style="dim"))
+            if stripped[0].isdigit():
+                stripped = stripped.lstrip(_DIGITS)[1:]
+            style = _STYLE_BY_PREFIX.get(stripped[:1], "dim")
+        lines.append(Text(line, style=style))
+
+    # One print for the whole diff instead of one per line
+    if lines:
+        console.print(Text("\n").join(lines))
@@ -28,10 +28,10 @@ class CommunicationFlowRenderer:
         # Build tree
         tree = Tree(self._format_agent_node(self.parent_status))
 
-        # Add children
-        for child_id in self.parent_status.child_sessions:
-            child_status = self.child_statuses.get(child_id)
-            if child_status:
+        # Add children (child_statuses keeps insertion order for display)
+        child_sessions = self.parent_status.child_sessions
+        for child_id, child_status in self.child_statuses.items():
+            if child_id in child_sessions:
                 tree.add(self._format_agent_node(child_status))
 
         return Panel(
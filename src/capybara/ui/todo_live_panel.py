@@ -1,6 +1,7 @@
 """Live-updating todo panel that renders independently from agent output."""
 
 import asyncio
+from collections.abc import Sequence
 
 from rich import box
 from rich.console import Console, Group
@@ -10,6 +11,20 @@ from rich.text import Text
 
 from capybara.tools.builtin.todo import TodoItem, TodoStatus
 
+_STATUS_ICONS = {
+    TodoStatus.PENDING: "☐",
+    TodoStatus.IN_PROGRESS: "◎",
+    TodoStatus.COMPLETED: "☑",
+    TodoStatus.CANCELLED: "☒",
+}
+
+_STATUS_STYLES = {
+    TodoStatus.PENDING: "white",
+    TodoStatus.IN_PROGRESS: "bold yellow",
+    TodoStatus.COMPLETED: "dim green",
+    TodoStatus.CANCELLED: "dim strike",
+}
+
 
 class LiveTodoPanel:
     """Live-updating todo panel displayed in a fixed terminal location.
@@ -27,11 +42,15 @@ class LiveTodoPanel:
         """
         self.console = console
         self.visible = visible
-        self.todos: list[TodoItem] = []
+        self.todos: Sequence[TodoItem] = ()
+        self._render_cache_key: tuple[tuple[TodoStatus, str], ...] | None = None
+        self._render_cache: Panel | None = None
         self._live: Live | None = None
         self._task: asyncio.Task | None = None
+        # Created in start(), where an event loop is guaranteed to be running
+        self._stop_event: asyncio.Event | None = None
 
-    def update_todos(self, new_todos: list[TodoItem]) -> None:
+    def update_todos(self, new_todos: Sequence[TodoItem]) -> None:
         """Update todo list and refresh display.
 
         Args:
@@ -45,25 +64,25 @@ class LiveTodoPanel:
 
         # Update live display if running
         if self._live:
-            self._live.update(self._render())
+            self._live.update(self._render(), refresh=True)
 
     def toggle_visibility(self) -> None:
         """Toggle panel visibility."""
         self.visible = not self.visible
         if self._live:
-            self._live.update(self._render())
+            self._live.update(self._render(), refresh=True)
 
     def show(self) -> None:
         """Show the panel."""
         self.visible = True
         if self._live:
-            self._live.update(self._render())
+            self._live.update(self._render(), refresh=True)
 
     def hide(self) -> None:
         """Hide the panel."""
         self.visible = False
         if self._live:
-            self._live.update(self._render())
+            self._live.update(self._render(), refresh=True)
 
     def _render(self) -> Text | Panel:
         """Render panel content.
@@ -74,15 +93,19 @@ class LiveTodoPanel:
         if not self.visible or not self.todos:
             return Text("")
 
+        # Reuse the rendered panel until a status or content changes
+        key = tuple((t.status, t.content) for t in self.todos)
+        if key == self._render_cache_key and self._render_cache is not None:
+            return self._render_cache
+
         items = []
         completed_count = 0
 
-        for todo in self.todos:
-            icon = self._get_icon(todo.status)
-            style = self._get_style(todo.status)
-            items.append(Text(f" {icon} {todo.content}", style=style))
+        for status, content in key:
+            icon = _STATUS_ICONS[status]
+            items.append(Text(f" {icon} {content}", style=_STATUS_STYLES[status]))
 
-            if todo.status == TodoStatus.COMPLETED:
+            if status is TodoStatus.COMPLETED:
                 completed_count += 1
 
         # Add progress footer
@@ -92,7 +115,8 @@ class LiveTodoPanel:
             footer_text += " · Ctrl+T to hide"
         items.append(Text(footer_text, style="dim"))
 
-        return Panel(
+        self._render_cache_key = key
+        self._render_cache = Panel(
             Group(*items),
             title="[bold]Plan[/bold]",
             title_align="left",
@@ -100,28 +124,7 @@ class LiveTodoPanel:
             box=box.MINIMAL,
             padding=(0, 1),
         )
-
-    def _get_icon(self, status: TodoStatus) -> str:
-        """Get status icon."""
-        if status == TodoStatus.COMPLETED:
-            return "☑"
-        elif status == TodoStatus.IN_PROGRESS:
-            return "◎"
-        elif status == TodoStatus.CANCELLED:
-            return "☒"
-        else:
-            return "☐"
-
-    def _get_style(self, status: TodoStatus) -> str:
-        """Get Rich style for status."""
-        if status == TodoStatus.COMPLETED:
-            return "dim green"
-        elif status == TodoStatus.IN_PROGRESS:
-            return "bold yellow"
-        elif status == TodoStatus.CANCELLED:
-            return "dim strike"
-        else:
-            return "white"
+        return self._render_cache
 
     async def start(self) -> None:
         """Start live display in background task."""
@@ -131,23 +134,20 @@ class LiveTodoPanel:
         self._live = Live(
             self._render(),
             console=self.console,
-            refresh_per_second=4,
             transient=False,
-            auto_refresh=True,
+            # Redrawn explicitly on every change, so there is no idle refresh
+            auto_refresh=False,
         )
 
-        self._task = asyncio.create_task(self._run_live())
+        self._stop_event = asyncio.Event()
+        self._task = asyncio.create_task(self._run_live(self._stop_event))
 
-    async def _run_live(self) -> None:
-        """Run live display loop."""
+    async def _run_live(self, stop_event: asyncio.Event) -> None:
+        """Keep the live display running until stop() is called."""
         try:
             if self._live:
                 self._live.start()
-            # Keep alive until stopped
-            while True:
-                await asyncio.sleep(0.1)
-        except asyncio.CancelledError:
-            pass
+            await stop_event.wait()
         finally:
             if self._live:
                 self._live.stop()
@@ -155,12 +155,11 @@ class LiveTodoPanel:
     async def stop(self) -> None:
         """Stop live display."""
         if self._task:
-            self._task.cancel()
-            try:
-                await self._task
-            except asyncio.CancelledError:
-                pass
+            if self._stop_event:
+                self._stop_event.set()
+            await self._task
             self._task = None
+            self._stop_event = None
 
         if self._live:
             self._live.stop()
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 from rich import box
 from rich.console import Group, RenderableType
 from rich.panel import Panel
@@ -10,6 +12,20 @@ from rich.text import Text
 from capybara.tools.builtin.todo import TodoItem, TodoStatus
 from capybara.tools.builtin.todo_state import todo_state
 
+_STATUS_ICONS = {
+    TodoStatus.PENDING: "☐",  # Ballot box
+    TodoStatus.IN_PROGRESS: "◎",  # Bullseye (indicates focus)
+    TodoStatus.COMPLETED: "☑",  # Ballot box with check
+    TodoStatus.CANCELLED: "☒",  # Ballot box with X
+}
+
+_STATUS_STYLES = {
+    TodoStatus.PENDING: "white",
+    TodoStatus.IN_PROGRESS: "bold yellow",
+    TodoStatus.COMPLETED: "dim green",
+    TodoStatus.CANCELLED: "dim strike",
+}
+
 
 class PersistentTodoPanel:
     """Persistent todo panel that displays at bottom of terminal.
@@ -31,12 +47,14 @@ class PersistentTodoPanel:
             visible: Initial visibility state (default: True)
         """
         self.visible = visible
-        self.todos: list[TodoItem] = []
+        self.todos: Sequence[TodoItem] = ()
+        self._render_cache_key: tuple[tuple[TodoStatus, str], ...] | None = None
+        self._render_cache: Panel | None = None
 
         # Subscribe to state changes
         todo_state.subscribe(self._on_todos_updated)
 
-    def _on_todos_updated(self, new_todos: list[TodoItem]) -> None:
+    def _on_todos_updated(self, new_todos: Sequence[TodoItem]) -> None:
         """Callback when todos change in state manager.
 
         Auto-shows panel when todos exist and it was hidden.
@@ -73,15 +91,19 @@ class PersistentTodoPanel:
         if not self.visible or not self.todos:
             return Text("")
 
+        # Reuse the rendered panel until a status or content changes
+        key = tuple((t.status, t.content) for t in self.todos)
+        if key == self._render_cache_key and self._render_cache is not None:
+            return self._render_cache
+
         items = []
         completed_count = 0
 
-        for todo in self.todos:
-            icon = self._get_icon(todo.status)
-            style = self._get_style(todo.status)
-            items.append(Text(f" {icon} {todo.content}", style=style))
+        for status, content in key:
+            icon = _STATUS_ICONS[status]
+            items.append(Text(f" {icon} {content}", style=_STATUS_STYLES[status]))
 
-            if todo.status == TodoStatus.COMPLETED:
+            if status is TodoStatus.COMPLETED:
                 completed_count += 1
 
         # Add progress footer
@@ -91,7 +113,8 @@ class PersistentTodoPanel:
             footer_text += " · Ctrl+T to hide"
         items.append(Text(footer_text, style="dim"))
 
-        return Panel(
+        self._render_cache_key = key
+        self._render_cache = Panel(
             Group(*items),
             title="[bold]Plan[/bold]",
             title_align="left",
@@ -99,42 +122,7 @@ class PersistentTodoPanel:
             box=box.MINIMAL,
             padding=(0, 1),
         )
-
-    def _get_icon(self, status: TodoStatus) -> str:
-        """Get status icon for todo item.
-
-        Args:
-            status: Todo status
-
-        Returns:
-            Unicode icon character
-        """
-        if status == TodoStatus.COMPLETED:
-            return "☑"  # Ballot box with check
-        elif status == TodoStatus.IN_PROGRESS:
-            return "◎"  # Bullseye (indicates focus)
-        elif status == TodoStatus.CANCELLED:
-            return "☒"  # Ballot box with X
-        else:  # PENDING
-            return "☐"  # Ballot box
-
-    def _get_style(self, status: TodoStatus) -> str:
-        """Get Rich style for todo item.
-
-        Args:
-            status: Todo status
-
-        Returns:
-            Rich style string
-        """
-        if status == TodoStatus.COMPLETED:
-            return "dim green"
-        elif status == TodoStatus.IN_PROGRESS:
-            return "bold yellow"
-        elif status == TodoStatus.CANCELLED:
-            return "dim strike"
-        else:  # PENDING
-            return "white"
+        return self._render_cache
 
     def cleanup(self) -> None:
         """Cleanup observers on exit."""
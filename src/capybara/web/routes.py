@@ -2,10 +2,10 @@
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
-from capybara.core.config import load_config, save_config
+from capybara.core.config import get_config_path, load_config, save_config
 from capybara.web.transformers import (
     transform_provider_for_ui,
     transform_provider_for_yaml,
@@ -78,17 +78,42 @@ class FetchModelsResponse(BaseModel):
     message: str = ""
 
 
+# GET /config response and the (mtime_ns, size) of the config file it was
+# built from; None as the key means the file didn't exist
+_config_cache: tuple[tuple[int, int] | None, ConfigResponse] | None = None
+
+
+def _config_file_key() -> tuple[int, int] | None:
+    """Get the config file's (mtime_ns, size), or None if it doesn't exist."""
+    try:
+        stat = get_config_path().stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
 @router.get("/config", response_model=ConfigResponse)
 async def get_config():
-    """Get current configuration for UI."""
+    """Get current configuration for UI.
+
+    The response is reused until the config file changes on disk.
+    """
+    global _config_cache
+    key = _config_file_key()
+    if _config_cache is not None and _config_cache[0] == key:
+        return _config_cache[1]
+
     config = load_config()
     providers = [ProviderUI(**transform_provider_for_ui(p)) for p in config.providers]
-    return ConfigResponse(providers=providers)
+    response = ConfigResponse(providers=providers)
+    _config_cache = (key, response)
+    return response
 
 
 @router.post("/config")
 async def save_config_endpoint(request: SaveConfigRequest):
     """Save configuration from UI."""
+    global _config_cache
     # Validate at least one provider with required fields
     for i, p in enumerate(request.providers):
         if not p.name.strip():
@@ -102,6 +127,7 @@ async def save_config_endpoint(request: SaveConfigRequest):
     config.providers = [transform_provider_for_yaml(p.model_dump()) for p in request.providers]
 
     save_config(config)
+    _config_cache = None
     return {"status": "ok"}
 
 
@@ -165,10 +191,8 @@ async def test_connection(request: TestConnectionRequest):
 
 
 @router.post("/fetch-models", response_model=FetchModelsResponse)
-async def fetch_models(request: FetchModelsRequest):
+async def fetch_models(request: FetchModelsRequest, http_request: Request):
     """Fetch available models from provider."""
-    import httpx
-
     provider = request.provider
     if not provider.api_base:
         return FetchModelsResponse(success=False, message="API Base URL is required")
@@ -180,17 +204,17 @@ async def fetch_models(request: FetchModelsRequest):
         headers["Authorization"] = f"Bearer {provider.api_key}"
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            response = await client.get(url, headers=headers)
-            response.raise_for_status()
-            data = response.json()
+        # Client shared across requests, created in the server lifespan
+        response = await http_request.app.state.http.get(url, headers=headers)
+        response.raise_for_status()
+        data = response.json()
 
-            # Parse OpenAI format {"data": [{"id": "..."}, ...]}
-            models = []
-            if "data" in data and isinstance(data["data"], list):
-                models = [m["id"] for m in data["data"] if "id" in m]
+        # Parse OpenAI format {"data": [{"id": "..."}, ...]}
+        models = []
+        if "data" in data and isinstance(data["data"], list):
+            models = [m["id"] for m in data["data"] if "id" in m]
 
-            return FetchModelsResponse(success=True, models=sorted(models))
+        return FetchModelsResponse(success=True, models=sorted(models))
 
     except Exception as e:
         logger.error(f"Failed to fetch models: {e}")
@@ -6,6 +6,7 @@ import webbrowser
 from contextlib import asynccontextmanager
 from pathlib import Path
 
+import httpx
 import uvicorn
 from fastapi import FastAPI
 from fastapi.responses import FileResponse
@@ -14,22 +15,31 @@ from capybara.web.routes import router, set_shutdown_callback
 
 
 def find_free_port(start: int = 8765) -> int:
-    """Find available port starting from given port."""
-    for port in range(start, start + 100):
-        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-            try:
-                s.bind(("127.0.0.1", port))
-                return port
-            except OSError:
-                continue
-    raise RuntimeError("No free port found")
+    """Find an available port, preferring the given one.
+
+    If the preferred port is taken, the kernel assigns a free one.
+    """
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        try:
+            s.bind(("127.0.0.1", start))
+        except OSError:
+            # Port 0 lets the kernel pick any free port in one bind
+            s.bind(("127.0.0.1", 0))
+        return int(s.getsockname()[1])
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage server lifecycle."""
-    yield
-    # Cleanup on shutdown
+    # Shared client so repeated provider requests reuse pooled connections
+    app.state.http = httpx.AsyncClient(
+        timeout=10.0, limits=httpx.Limits(max_keepalive_connections=20)
+    )
+    try:
+        yield
+    finally:
+        # Cleanup on shutdown
+        await app.state.http.aclose()
 
 
 def create_app() -> FastAPI:
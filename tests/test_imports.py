@@ -0,0 +1,39 @@
+"""Import smoke tests: modules that build state at import time must load cleanly."""
+
+import importlib
+
+import pytest
+
+MODULES = [
+    "capybara.core.utils",
+    "capybara.core.utils.prompts",
+    "capybara.tools.builtin.delegation.agent_setup",
+    "capybara.tools.builtin.delegation.pool",
+    "capybara.cli.interactive",
+    "capybara.cli.main",
+]
+
+
+@pytest.mark.parametrize("module", MODULES)
+def test_module_imports(module):
+    """Importing the module doesn't raise."""
+    importlib.import_module(module)
+
+
+@pytest.mark.parametrize("mode", ["standard", "plan"])
+def test_system_prompt_formats(mode):
+    """Prompt templates only contain the project_context placeholder."""
+    from capybara.core.utils.prompts import build_system_prompt
+
+    prompt = build_system_prompt("ctx", mode=mode)
+    assert "ctx" in prompt
+    assert "{project_context}" not in prompt
+
+
+def test_child_system_prompt_formats():
+    """Child prompt template only contains the project_context placeholder."""
+    from capybara.core.utils.prompts import build_child_system_prompt
+
+    prompt = build_child_system_prompt("ctx")
+    assert "ctx" in prompt
+    assert "{project_context}" not in prompt